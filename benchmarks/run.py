@@ -0,0 +1,219 @@
+"""
+Benchmarks of django-smart-pagination.
+
+Run from the root of the repository:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare baseline.json --threshold 0.25
+
+Every benchmark reports the best time of one call, in seconds, over several repeats.
+With ``--compare``, the run fails when a benchmark is slower than the baseline by more
+than ``--threshold`` (a fraction of the baseline time).
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.django_settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.core.paginator import Paginator  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.http import QueryDict, HttpRequest  # noqa: E402
+from django.template import Context, Template  # noqa: E402
+from jinja2 import Environment  # noqa: E402
+
+from smart_pagination import pagination, windows  # noqa: E402
+from smart_pagination.approximate import ApproximateCountPaginator  # noqa: E402
+from smart_pagination.deferred import DeferredJoinPaginator  # noqa: E402
+from smart_pagination.keyset import LAST, KeysetPaginator, encode_cursor  # noqa: E402
+from smart_pagination.lookahead import LookaheadPaginator  # noqa: E402
+from smart_pagination.templatetags.pagination_jinja import PaginationExtension  # noqa: E402
+from tests.models import Item  # noqa: E402
+
+PAGE_COUNTS = (10, 10 ** 3, 10 ** 5, 10 ** 8)
+NUM_LINKS = (1, 5, 10, 50)
+QUERY_SIZES = (1, 10, 100, 1000)
+
+BODY = (
+    '{% for page in paging.pages %}'
+    '<a href="?page={{ page.number }}&{{ paging.query }}">{{ page.number }}</a>'
+    '{% endfor %}'
+)
+
+
+def measure(function, repeat):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def make_request(size):
+    request = HttpRequest()
+    request.GET = QueryDict('', mutable=True)
+    request.GET.update(dict(('param{}'.format(i), 'value {}'.format(i)) for i in range(size)))
+    request.GET['page'] = '2'
+    return request
+
+
+def engine_benchmarks():
+    for page_count in PAGE_COUNTS:
+        page = Paginator(range(page_count), 1).page(page_count // 2 or 1)
+
+        for num_links in NUM_LINKS:
+            yield 'make_paginator[pages={},links={}]'.format(page_count, num_links), (
+                lambda page=page, num_links=num_links: pagination.make_paginator(page, num_links)
+            )
+
+            def cold(page=page, num_links=num_links):
+                pagination.clear_window_cache()
+                pagination.make_paginator(page, num_links)
+
+            yield 'make_paginator_cold[pages={},links={}]'.format(page_count, num_links), cold
+
+    yield 'iter_windows[pages=10000,links=10]', lambda: list(windows.iter_windows(10000, 10, '?page='))
+
+    for size in QUERY_SIZES:
+        request = make_request(size)
+        yield 'process_querystring[params={}]'.format(size), (
+            lambda request=request: pagination._process_querystring(request, 'page')
+        )
+
+
+def render_benchmarks():
+    page = Paginator(range(10 ** 6), 10).page(5000)
+    request = make_request(10)
+
+    template = Template(
+        '{% load pagination_tags %}{% paginate page_obj 10 paging "page" %}' + BODY + '{% endpaginate %}'
+    )
+
+    def django_render():
+        request.__dict__.pop('_smart_pagination_querystrings', None)
+        template.render(Context({'page_obj': page, 'request': request}))
+
+    yield 'render[django]', django_render
+
+    theme_template = Template("{% load pagination_tags %}{% render_pagination page_obj 10 'page' theme='bootstrap' %}")
+
+    def theme_render():
+        request.__dict__.pop('_smart_pagination_querystrings', None)
+        theme_template.render(Context({'page_obj': page, 'request': request}))
+
+    yield 'render[django,theme]', theme_render
+
+    env = Environment(extensions=[PaginationExtension])
+    jinja_template = env.from_string('{% paginate page_obj 10 paging "page" %}' + BODY + '{% endpaginate %}')
+
+    def jinja_render():
+        request.__dict__.pop('_smart_pagination_querystrings', None)
+        jinja_template.render(page_obj=page, request=request)
+
+    yield 'render[jinja]', jinja_render
+
+
+def database_benchmarks(rows):
+    call_command('migrate', run_syncdb=True, verbosity=0)
+    Item.objects.bulk_create(
+        (Item(name='item {}'.format(i), position=i) for i in range(rows)), batch_size=10000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+    queryset = Item.objects.order_by('position', 'id')
+    deep = rows // 10 - 1
+
+    yield 'db_count[exact]', lambda: Paginator(queryset, 10).count
+    yield 'db_count[approximate]', lambda: ApproximateCountPaginator(queryset, 10, threshold=1).count
+
+    for number in (10, deep):
+        yield 'db_page[offset,page={}]'.format(number), (
+            lambda number=number: list(Paginator(queryset, 10).page(number))
+        )
+        yield 'db_page[deferred,page={}]'.format(number), (
+            lambda number=number: list(DeferredJoinPaginator(queryset, 10).page(number))
+        )
+        yield 'db_page[lookahead,page={}]'.format(number), (
+            lambda number=number: list(LookaheadPaginator(queryset, 10).page(number))
+        )
+
+    keyset = KeysetPaginator(queryset, 10)
+    cursor = keyset.page().next_cursor
+    yield 'db_page[keyset,page=2]', lambda: list(keyset.page(cursor))
+
+    last = keyset.page(encode_cursor(LAST))
+    yield 'db_page[keyset,deep]', lambda: list(keyset.page(last.previous_cursor))
+
+
+def run(args):
+    groups = [engine_benchmarks(), render_benchmarks()]
+    if not args.skip_database:
+        groups.append(database_benchmarks(args.rows))
+
+    results = {}
+    for group in groups:
+        for name, function in group:
+            if args.filter and args.filter not in name:
+                continue
+
+            results[name] = measure(function, args.repeat)
+            print('{:<55} {:>12.3f} us'.format(name, results[name] * 1e6))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+
+    for name, seconds in sorted(results.items()):
+        if name in baseline and seconds > baseline[name] * (1 + threshold):
+            regressions.append((name, baseline[name], seconds))
+
+    for name, before, after in regressions:
+        print('REGRESSION {}: {:.3f} us -> {:.3f} us (+{:.0%})'.format(
+            name, before * 1e6, after * 1e6, after / before - 1,
+        ))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare the results to this JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown over the baseline')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--rows', type=int, default=100000, help='rows of the database benchmarks')
+    parser.add_argument('--skip-database', action='store_true')
+    parser.add_argument('--filter', help='only run the benchmarks whose name contains this text')
+    args = parser.parse_args()
+
+    results = run(args)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,7 +14,7 @@ os.chdir(os.path.normpath(os.path.join(os.path.abspath(__file__), os.pardir)))
 
 setup(
     name='django-smart-pagination',
-    version='1.0.1',
+    version='2.0.0',
     packages=find_packages(exclude=['tests']),
     description='Generate pagination links in Django Templates',
     long_description=long_description,
@@ -30,17 +30,26 @@ setup(
         'License :: OSI Approved :: BSD License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
+        'Framework :: Django :: 4.1',
+        'Framework :: Django :: 4.2',
+        'Framework :: Django :: 5.0',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Topic :: Internet :: WWW/HTTP',
         'Topic :: Internet :: WWW/HTTP :: Dynamic Content',
     ],
 
     keywords='django pagination page links',
-    install_requires=['Django'],
+    python_requires='>=3.8',
+    install_requires=['Django>=4.1'],
     extras_require={
         'test': ['pytest', 'pytest-cov', 'pytest-django', 'Jinja2'],
+        'orjson': ['orjson'],
+        'numpy': ['numpy'],
     }
 )
@@ -0,0 +1,111 @@
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def _is_unfiltered(query):
+    return not query.where and not query.distinct and query.low_mark == 0 and query.high_mark is None
+
+
+def _compile(queryset):
+    # Compiled for the database of the queryset, which sql_with_params() ignores
+    return queryset.query.get_compiler(queryset.db).as_sql()
+
+
+def _postgresql_estimate(queryset, cursor):
+    if _is_unfiltered(queryset.query):
+        # to_regclass() is NULL instead of an error, which would abort the transaction, for a missing table
+        table = connections[queryset.db].ops.quote_name(queryset.model._meta.db_table)
+        cursor.execute('SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)', [table])
+        row = cursor.fetchone()
+        # reltuples is -1 (or 0 on older versions) for tables that were never analyzed
+        return int(row[0]) if row and row[0] is not None and row[0] > 0 else None
+
+    sql, params = _compile(queryset)
+    cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+    plan = cursor.fetchone()[0]
+    if not isinstance(plan, list):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _mysql_estimate(queryset, cursor):
+    if _is_unfiltered(queryset.query):
+        cursor.execute(
+            'SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else None
+
+    sql, params = _compile(queryset)
+    cursor.execute('EXPLAIN ' + sql, params)
+    columns = [column[0].lower() for column in cursor.description]
+    row = cursor.fetchone()
+    return int(row[columns.index('rows')]) if row and 'rows' in columns else None
+
+
+def _sqlite_estimate(queryset, cursor):
+    # SQLite has no row estimate for arbitrary queries, only table statistics collected by ANALYZE
+    if not _is_unfiltered(queryset.query):
+        return None
+
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+    if cursor.fetchone() is None:
+        return None
+
+    cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1', [queryset.model._meta.db_table])
+    row = cursor.fetchone()
+    return int(row[0].split()[0]) if row else None
+
+
+ESTIMATORS = {
+    'postgresql': _postgresql_estimate,
+    'mysql': _mysql_estimate,
+    'sqlite': _sqlite_estimate,
+}
+
+
+def estimate_count(queryset):
+    """
+    Return the number of rows the database statistics estimate for ``queryset``,
+    or ``None`` when the backend cannot provide an estimate.
+    """
+    connection = connections[queryset.db]
+    estimator = ESTIMATORS.get(connection.vendor)
+
+    if estimator is None:
+        return None
+
+    with connection.cursor() as cursor:
+        return estimator(queryset, cursor)
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    Paginator that takes the row count from the database statistics instead of
+    running ``COUNT(*)``. Results estimated below ``threshold`` rows are counted
+    exactly, since counting small results is cheap and their page count matters more.
+    """
+
+    threshold = 10000
+
+    def __init__(self, *args, **kwargs):
+        threshold = kwargs.pop('threshold', None)
+        super(ApproximateCountPaginator, self).__init__(*args, **kwargs)
+        self.approximate = False
+
+        if threshold is not None:
+            self.threshold = threshold
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list) if hasattr(self.object_list, 'query') else None
+
+        if estimate is None or estimate < self.threshold:
+            return super(ApproximateCountPaginator, self).count
+
+        self.approximate = True
+        return estimate
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+
+
+def _count_queryset(queryset):
+    query = queryset.query
+
+    # The ordering only matters to the rows kept by a slice
+    if not query.is_sliced:
+        queryset = queryset.order_by()
+
+    # DISTINCT, GROUP BY and combined queries count the rows of their own select list
+    if (query.distinct or query.combinator or query.group_by is not None
+            or any(getattr(annotation, 'contains_aggregate', False) for annotation in query.annotations.values())):
+        return queryset
+
+    # Otherwise only the primary key is selected, which the database can count from an index and
+    # which avoids the duplicate column names of joined tables in the derived table
+    return queryset.select_related(None).values('pk')
+
+
+def batch_count(*querysets):
+    """
+    Count the rows of several querysets with one ``UNION ALL`` query per database
+    and return the counts in the same order.
+    """
+    counts = [None] * len(querysets)
+    by_alias = OrderedDict()
+
+    for i, queryset in enumerate(querysets):
+        by_alias.setdefault(queryset.db, []).append(i)
+
+    for alias, indexes in by_alias.items():
+        connection = connections[alias]
+        selects, params = [], []
+
+        for i in indexes:
+            queryset = _count_queryset(querysets[i])
+
+            try:
+                sql, query_params = queryset.query.get_compiler(using=alias).as_sql()
+            except EmptyResultSet:
+                counts[i] = 0
+                continue
+
+            alias_name = connection.ops.quote_name('batch_{}'.format(i))
+            selects.append('SELECT {}, COUNT(*) FROM ({}) {}'.format(i, sql, alias_name))
+            params.extend(query_params)
+
+        if selects:
+            with connection.cursor() as cursor:
+                cursor.execute(' UNION ALL '.join(selects), params)
+
+                for i, count in cursor.fetchall():
+                    counts[i] = count
+
+    return counts
+
+
+def _needs_count(paginator):
+    # Paginators with their own way of counting, like ApproximateCountPaginator, are left alone
+    return (
+        'count' not in paginator.__dict__
+        and type(paginator).count is Paginator.count
+        and hasattr(paginator.object_list, 'query')
+        and not getattr(paginator, 'count_free', False)
+    )
+
+
+def prepare_paginators(*paginators):
+    """
+    Count the rows of several paginators at once, with ``batch_count``, so that building
+    their pages and rendering them with ``make_paginator`` or the template tags does not
+    send one ``COUNT`` query each. It must be called before any of the pages is built.
+
+    Return the paginators that were counted.
+    """
+    paginators = [paginator for paginator in paginators if _needs_count(paginator)]
+    counts = batch_count(*[paginator.object_list for paginator in paginators])
+
+    for paginator, count in zip(paginators, counts):
+        paginator.__dict__['count'] = count
+
+    return paginators
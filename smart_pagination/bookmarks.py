@@ -0,0 +1,130 @@
+import hashlib
+
+from django.core.cache import caches
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from .keyset import KeysetPaginator
+
+KEY_PREFIX = 'smart_pagination:bookmark'
+
+
+class BookmarkPaginator(Paginator):
+    """
+    Numbered paginator that remembers, in a Django cache, the sort key of the first row
+    of every ``interval`` pages. A page is then fetched by seeking to the nearest
+    bookmark before it and offsetting less than ``interval`` pages from there.
+    Missing bookmarks are recorded from the nearest one recorded before them, one
+    interval at a time, and bookmarked pages record their own as they are served.
+
+    The queryset must be ordered by non-null concrete fields, as with ``KeysetPaginator``.
+    Bookmarks expire after ``timeout`` seconds, since inserts and deletes shift the rows
+    that start each page.
+    """
+
+    interval = 100
+    cache_alias = 'default'
+    timeout = 3600
+
+    def __init__(self, object_list, per_page, *args, **kwargs):
+        ordering = kwargs.pop('ordering', None)
+        for name in ('interval', 'cache_alias', 'timeout'):
+            value = kwargs.pop(name, None)
+            if value is not None:
+                setattr(self, name, value)
+
+        super(BookmarkPaginator, self).__init__(object_list, per_page, *args, **kwargs)
+        self.keyset = KeysetPaginator(object_list, per_page, ordering)
+
+    def _ordered(self):
+        return self.object_list.order_by(*self.keyset._order_by())
+
+    @cached_property
+    def _digest(self):
+        sql, params = self.object_list.order_by().query.sql_with_params()
+        state = (self.object_list.db, sql, params, self.keyset.fields, self.per_page)
+        return hashlib.sha1(repr(state).encode('utf-8')).hexdigest()
+
+    def _bookmark_key(self, number):
+        return '{}:{}:{}'.format(KEY_PREFIX, self._digest, number)
+
+    def _names(self):
+        return [name for name, descending in self.keyset.fields]
+
+    def _nearest(self, number):
+        """
+        Return the number and the sort key of the nearest recorded bookmark up to
+        bookmark ``number``, or page 1 and ``None`` when there is none.
+        """
+        numbers = range(number, 1, -self.interval)
+        found = caches[self.cache_alias].get_many([self._bookmark_key(n) for n in numbers])
+
+        for n in numbers:
+            values = found.get(self._bookmark_key(n))
+            if values is not None:
+                return n, values
+
+        return 1, None
+
+    def _walk(self, found, values, number):
+        # Record every bookmark from ``found`` to ``number``, offsetting one interval at a time
+        cache = caches[self.cache_alias]
+
+        while found < number:
+            queryset = self._ordered()
+            if values is not None:
+                queryset = queryset.filter(self.keyset._seek(values, inclusive=True))
+
+            offset = self.interval * self.per_page
+            rows = list(queryset.values_list(*self._names())[offset:offset + 1])
+            if not rows:
+                return None
+
+            found += self.interval
+            values = list(rows[0])
+            cache.set(self._bookmark_key(found), values, self.timeout)
+
+        return values
+
+    def get_bookmark(self, number):
+        """
+        Return the sort key of the first row of page ``number``, recording it when it is missing.
+        """
+        found, values = self._nearest(number)
+        return self._walk(found, values, number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        queryset = self._ordered()
+        bookmark = (number - 1) // self.interval * self.interval + 1
+        found, values, record = 1, None, False
+
+        if bookmark > 1:
+            found, values = self._nearest(bookmark)
+
+            if found < bookmark:
+                # The first row of a bookmarked page is its bookmark, so that page records it
+                record = number == bookmark
+                target = bookmark - self.interval if record else bookmark
+                values = self._walk(found, values, target)
+                found = target if values is not None else 1
+
+        if values is not None:
+            queryset = queryset.filter(self.keyset._seek(values, inclusive=True))
+            skipped = (found - 1) * self.per_page
+            bottom -= skipped
+            top -= skipped
+
+        rows = queryset[bottom:top]
+
+        if record:
+            rows = list(rows)
+            if rows:
+                caches[self.cache_alias].set(self._bookmark_key(bookmark), self.keyset.get_key(rows[0]), self.timeout)
+
+        return self._get_page(rows, number, self)
@@ -0,0 +1,179 @@
+import time
+from contextlib import contextmanager
+
+from django.core.paginator import Paginator
+from django.db import OperationalError, connections, transaction
+from django.utils.functional import cached_property
+
+from . import instrumentation
+from .lookahead import LookaheadPaginator
+
+# Number of SQLite virtual machine instructions between two checks of the deadline
+SQLITE_PROGRESS_STEPS = 1000
+
+
+class CountTimeout(Exception):
+    pass
+
+
+@contextmanager
+def _session_variable(cursor, name, value):
+    cursor.execute('SELECT @@SESSION.{}'.format(name))
+    previous = cursor.fetchone()[0]
+    cursor.execute('SET SESSION {} = %s'.format(name), [value])
+    try:
+        yield
+    finally:
+        cursor.execute('SET SESSION {} = %s'.format(name), [previous])
+
+
+def _postgresql_count(queryset, connection, budget):
+    try:
+        # Rolling back the savepoint of a cancelled count also restores the timeout
+        with transaction.atomic(using=queryset.db):
+            with connection.cursor() as cursor:
+                cursor.execute('SHOW statement_timeout')
+                previous = cursor.fetchone()[0]
+                cursor.execute("SELECT set_config('statement_timeout', %s, true)", [str(max(1, int(budget * 1000)))])
+                count = queryset.count()
+                cursor.execute("SELECT set_config('statement_timeout', %s, true)", [previous])
+    except OperationalError as e:
+        # query_canceled
+        cause = e.__cause__
+        if getattr(cause, 'pgcode', None) == '57014' or getattr(cause, 'sqlstate', None) == '57014':
+            raise CountTimeout
+        raise
+
+    return count
+
+
+def _mysql_count(queryset, connection, budget):
+    if connection.mysql_is_mariadb:
+        variable, value, error = 'max_statement_time', budget, 1969
+    else:
+        variable, value, error = 'max_execution_time', max(1, int(budget * 1000)), 3024
+
+    try:
+        with connection.cursor() as cursor, _session_variable(cursor, variable, value):
+            return queryset.count()
+    except OperationalError as e:
+        if e.args and e.args[0] == error:
+            raise CountTimeout
+        raise
+
+
+def _sqlite_count(queryset, connection, budget):
+    deadline = time.perf_counter() + budget
+
+    def handler():
+        return time.perf_counter() > deadline
+
+    connection.ensure_connection()
+    connection.connection.set_progress_handler(handler, SQLITE_PROGRESS_STEPS)
+    try:
+        return queryset.count()
+    except OperationalError as e:
+        if 'interrupted' in str(e):
+            raise CountTimeout
+        raise
+    finally:
+        connection.connection.set_progress_handler(None, SQLITE_PROGRESS_STEPS)
+
+
+COUNTERS = {
+    'postgresql': _postgresql_count,
+    'mysql': _mysql_count,
+    'sqlite': _sqlite_count,
+}
+
+
+def budget_count(queryset, budget):
+    """
+    Return the count of ``queryset``, or raise ``CountTimeout`` when the database takes
+    more than ``budget`` seconds to make it. Backends other than PostgreSQL, MySQL,
+    MariaDB and SQLite count without a budget.
+    """
+    connection = connections[queryset.db]
+    counter = COUNTERS.get(connection.vendor)
+
+    if counter is None:
+        return queryset.count()
+
+    return counter(queryset, connection, budget)
+
+
+class BudgetPaginator(LookaheadPaginator):
+    """
+    Paginator that gives up counting the rows when the count takes longer than ``budget``
+    seconds. Its pages are then those of ``LookaheadPaginator``, ``num_pages`` and
+    ``page_range`` are ``None``, and ``make_paginator`` builds their links up to the
+    next page, without a last page, setting the ``count_timed_out`` flag of the links.
+
+    The timeout is reported to the observers of ``instrumentation`` as ``count_timeout``,
+    with the ``source`` of the paginator, by default the label of the model.
+    """
+
+    budget = 0.5
+    count_timed_out = False
+
+    def __init__(self, object_list, per_page, *args, **kwargs):
+        budget = kwargs.pop('budget', None)
+        self.source = kwargs.pop('source', None)
+        super(BudgetPaginator, self).__init__(object_list, per_page, *args, **kwargs)
+
+        if budget is not None:
+            self.budget = budget
+
+        if self.source is None and hasattr(object_list, 'model'):
+            self.source = object_list.model._meta.label_lower
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return super(BudgetPaginator, self).count
+
+        start = time.perf_counter()
+
+        try:
+            return budget_count(self.object_list, self.budget)
+        except CountTimeout:
+            self.count_timed_out = True
+
+            if instrumentation.observers:
+                instrumentation.report(instrumentation.Measurement(
+                    'count_timeout', time.perf_counter() - start, 1, None, None, self.source,
+                ))
+
+            return None
+
+    @cached_property
+    def num_pages(self):
+        # Unknown once the count timed out, so that ListView answers 404 to page=last instead of failing
+        if self.count is None:
+            return None
+
+        return super(BudgetPaginator, self).num_pages
+
+    @property
+    def page_range(self):
+        if self.count is None:
+            return None
+
+        return super(BudgetPaginator, self).page_range
+
+    @property
+    def count_free(self):
+        # Only known once the count was tried, so that async code is not made to count here
+        return self.__dict__.get('count', 0) is None
+
+    def validate_number(self, number):
+        if self.count is None:
+            return super(BudgetPaginator, self).validate_number(number)
+
+        return Paginator.validate_number(self, number)
+
+    def page(self, number):
+        if self.count is None:
+            return super(BudgetPaginator, self).page(number)
+
+        return Paginator.page(self, number)
@@ -0,0 +1,141 @@
+import hashlib
+import time
+import uuid
+
+from django.core.cache import caches
+from django.core.paginator import Paginator
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import cached_property
+
+KEY_PREFIX = 'smart_pagination:count'
+
+# Seconds a count is kept after it was invalidated, to be served while a new one is computed
+STALE_TIMEOUT = 3600
+
+
+def _generation_key(model):
+    return '{}:generation:{}'.format(KEY_PREFIX, model._meta.label_lower)
+
+
+def _generation(cache, model):
+    return cache.get_or_set(_generation_key(model), 0, None)
+
+
+def _digest(queryset):
+    sql, params = queryset.order_by().query.sql_with_params()
+    return hashlib.sha1(repr((queryset.db, sql, params)).encode('utf-8')).hexdigest()
+
+
+def count_cache_key(queryset, cache):
+    """
+    Build the cache key of the count of ``queryset`` from its compiled SQL and parameters.
+    Ordering does not change the count, so it is left out of the key.
+    """
+    generation = _generation(cache, queryset.model)
+    return '{}:{}:{}:{}'.format(KEY_PREFIX, queryset.model._meta.label_lower, generation, _digest(queryset))
+
+
+def _stale_key(queryset):
+    return '{}:{}:stale:{}'.format(KEY_PREFIX, queryset.model._meta.label_lower, _digest(queryset))
+
+
+def cached_count(queryset, cache_alias='default', timeout=60, lock_timeout=10, wait_timeout=0.2):
+    """
+    Return the count of ``queryset``, reading it from the cache when possible.
+
+    Only one process recomputes a missing count: the others wait for it to be
+    stored, at most ``wait_timeout`` seconds, instead of sending the same ``COUNT``
+    to the database at once. Past that, they return the last count stored before
+    the invalidation, or count by themselves when there is none.
+    """
+    cache = caches[cache_alias]
+    key = count_cache_key(queryset, cache)
+
+    count = cache.get(key)
+    if count is not None:
+        return count
+
+    lock_key = key + ':lock'
+    token = uuid.uuid4().hex
+
+    if not cache.add(lock_key, token, lock_timeout):
+        deadline = time.time() + wait_timeout
+        while time.time() < deadline:
+            time.sleep(0.05)
+            count = cache.get(key)
+            if count is not None:
+                return count
+
+        count = cache.get(_stale_key(queryset))
+        if count is not None:
+            return count
+
+        return queryset.count()
+
+    try:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+        cache.set(_stale_key(queryset), count, STALE_TIMEOUT)
+    finally:
+        # The lock may have expired and been taken by another process meanwhile
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+    return count
+
+
+def invalidate_count(queryset, cache_alias='default'):
+    cache = caches[cache_alias]
+    cache.delete(count_cache_key(queryset, cache))
+
+
+def invalidate_model(model, cache_alias='default'):
+    """
+    Invalidate every cached count of ``model`` by moving it to a new key generation.
+    """
+    cache = caches[cache_alias]
+    key = _generation_key(model)
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def invalidate_on_change(model, cache_alias='default'):
+    """
+    Invalidate the cached counts of ``model`` whenever one of its instances is saved or deleted.
+    """
+    def receiver(sender, **kwargs):
+        invalidate_model(sender, cache_alias)
+
+    dispatch_uid = 'smart_pagination.cache:{}:{}'.format(model._meta.label_lower, cache_alias)
+    post_save.connect(receiver, sender=model, weak=False, dispatch_uid=dispatch_uid)
+    post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=dispatch_uid)
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that keeps the count of its queryset in a Django cache for ``timeout`` seconds.
+    """
+
+    cache_alias = 'default'
+    timeout = 60
+
+    def __init__(self, *args, **kwargs):
+        cache_alias = kwargs.pop('cache_alias', None)
+        timeout = kwargs.pop('timeout', None)
+        super(CachedCountPaginator, self).__init__(*args, **kwargs)
+
+        if cache_alias is not None:
+            self.cache_alias = cache_alias
+
+        if timeout is not None:
+            self.timeout = timeout
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return super(CachedCountPaginator, self).count
+
+        return cached_count(self.object_list, self.cache_alias, self.timeout)
@@ -0,0 +1,148 @@
+import datetime
+import functools
+import hashlib
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import Paginator
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from . import pagination
+
+
+def probe(queryset, last_modified_field=None):
+    """
+    Return the count of ``queryset`` and the latest value of ``last_modified_field``
+    (``None`` without it) with a single query.
+    """
+    if not queryset.query.is_sliced:
+        queryset = queryset.order_by()
+
+    aggregates = {'count': Count('*')}
+    if last_modified_field:
+        aggregates['last_modified'] = Max(last_modified_field)
+
+    result = queryset.aggregate(**aggregates)
+    return result['count'], result.get('last_modified')
+
+
+def page_etag(count, last_modified, number, per_page, query):
+    """
+    Build the ETag of a page from everything its rows and links depend on.
+    """
+    if last_modified is not None:
+        last_modified = last_modified.isoformat()
+
+    state = repr((count, last_modified, str(number), per_page, query))
+    return quote_etag(hashlib.sha1(state.encode('utf-8')).hexdigest())
+
+
+def _timestamp(last_modified):
+    if last_modified is None:
+        return None
+
+    if not timezone.is_aware(last_modified):
+        last_modified = timezone.make_aware(last_modified, datetime.timezone.utc)
+
+    return int(last_modified.timestamp())
+
+
+def conditional_page_response(request, queryset, per_page, number, page_kwarg, last_modified_field, get_response,
+                              send_last_modified=False):
+    """
+    Answer ``304 Not Modified`` (or ``412 Precondition Failed``) when the page the client
+    has is still current, else return ``get_response(count)`` with an ``ETag`` header.
+    Only the probe query is sent before deciding.
+
+    The latest value of ``last_modified_field`` does not change when rows are deleted, so
+    ``Last-Modified`` is only sent, and ``If-Modified-Since`` only honoured, with
+    ``send_last_modified``, for listings whose rows are never deleted.
+    """
+    if not last_modified_field:
+        # Without it, rows changed in place would keep the ETag of their old content
+        raise ImproperlyConfigured('Conditional pagination requires a last_modified_field')
+
+    count, last_modified = probe(queryset, last_modified_field)
+    query = pagination.process_querystring(request, page_kwarg)
+
+    etag = page_etag(count, last_modified, number, per_page, query)
+    timestamp = _timestamp(last_modified) if send_last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        return response
+
+    response = get_response(count)
+
+    if timestamp is not None and not response.has_header('Last-Modified'):
+        response.headers['Last-Modified'] = http_date(timestamp)
+    response.headers.setdefault('ETag', etag)
+
+    return response
+
+
+def condition_on_page(queryset, per_page, last_modified_field, page_kwarg='page', send_last_modified=False):
+    """
+    Decorator of views that render one page of ``queryset``, which may also be a function
+    of the arguments of the view that returns the queryset.
+    """
+    if not last_modified_field:
+        raise ImproperlyConfigured('condition_on_page requires a last_modified_field')
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            objects = queryset(request, *args, **kwargs) if callable(queryset) else queryset
+            number = kwargs.get(page_kwarg) or request.GET.get(page_kwarg) or 1
+
+            return conditional_page_response(
+                request, objects, per_page, number, page_kwarg, last_modified_field,
+                lambda count: view(request, *args, **kwargs), send_last_modified,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class ConditionalPaginationMixin(object):
+    """
+    Mixin of ``ListView`` that answers ``304 Not Modified`` to clients that already have the
+    requested page. The count of the probe is reused by the paginator of the view.
+    ``last_modified_field`` must be set.
+    """
+
+    last_modified_field = None
+    send_last_modified = False
+    probed_count = None
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        per_page = self.get_paginate_by(queryset)
+
+        if not per_page:
+            return super(ConditionalPaginationMixin, self).get(request, *args, **kwargs)
+
+        number = self.kwargs.get(self.page_kwarg) or request.GET.get(self.page_kwarg) or 1
+
+        def get_response(count):
+            self.probed_count = count
+            return super(ConditionalPaginationMixin, self).get(request, *args, **kwargs)
+
+        return conditional_page_response(
+            request, queryset, per_page, number, self.page_kwarg, self.last_modified_field, get_response,
+            self.send_last_modified,
+        )
+
+    def get_paginator(self, *args, **kwargs):
+        paginator = super(ConditionalPaginationMixin, self).get_paginator(*args, **kwargs)
+
+        if self.probed_count is not None and type(paginator).count is Paginator.count:
+            paginator.__dict__['count'] = self.probed_count
+
+        return paginator
@@ -0,0 +1,199 @@
+from collections import Counter
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import Paginator
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save
+from django.utils.functional import cached_property
+
+STATE_ATTR = '_smart_pagination_counted'
+
+_registry = {}
+
+
+def filter_key(filters):
+    return '&'.join('{}={}'.format(name, filters[name]) for name in sorted(filters))
+
+
+def _snapshot(model, instance, loaded_only=False):
+    values = {}
+    for name in set(name for filters in _registry[model] for name in filters):
+        attname = model._meta.get_field(name).attname
+        # Reading a deferred field would run a query for every instance loaded
+        if not loaded_only or attname in instance.__dict__:
+            values[name] = getattr(instance, attname)
+    return values
+
+
+def _matching_keys(model, values):
+    return set(filter_key(filters) for filters in _registry[model]
+               if all(values[name] == value for name, value in filters.items()))
+
+
+def _filters_for_key(model, key):
+    for filters in _registry[model]:
+        if filter_key(filters) == key:
+            return filters
+    raise ImproperlyConfigured('Row counter of "{}" is not registered for "{}"'.format(model._meta.label, key))
+
+
+def _row_counts(using):
+    # The models of the app cannot be imported with the package, which Django loads first
+    from .models import RowCount
+    return RowCount.objects.using(using)
+
+
+def exact_count(model, filters, using=DEFAULT_DB_ALIAS):
+    return model._default_manager.using(using).filter(**filters).count()
+
+
+def adjust(model, key, delta, using=DEFAULT_DB_ALIAS):
+    """
+    Atomically add ``delta`` to the counter of ``model`` identified by ``key``.
+    A missing counter is created from an exact count instead.
+    """
+    label = model._meta.label_lower
+    counters = _row_counts(using).filter(model=label, filter_key=key)
+
+    if not counters.update(count=F('count') + delta):
+        count = exact_count(model, _filters_for_key(model, key), using)
+        _row_counts(using).get_or_create(model=label, filter_key=key, defaults={'count': count})
+
+
+def _post_init(sender, instance, **kwargs):
+    setattr(instance, STATE_ATTR, _snapshot(sender, instance, loaded_only=True))
+
+
+def _post_save(sender, instance, created, using, **kwargs):
+    values = _snapshot(sender, instance)
+    new_keys = _matching_keys(sender, values)
+
+    if created:
+        old_keys = set()
+    else:
+        old_values = dict(values)
+        old_values.update(getattr(instance, STATE_ATTR, {}))
+        old_keys = _matching_keys(sender, old_values)
+
+    for key in old_keys - new_keys:
+        adjust(sender, key, -1, using)
+
+    for key in new_keys - old_keys:
+        adjust(sender, key, 1, using)
+
+    setattr(instance, STATE_ATTR, values)
+
+
+def _post_delete(sender, instance, using, **kwargs):
+    values = _snapshot(sender, instance)
+    values.update(getattr(instance, STATE_ATTR, {}))
+
+    for key in _matching_keys(sender, values):
+        adjust(sender, key, -1, using)
+
+
+def register(model, filters=None):
+    """
+    Maintain the row count of ``model`` and, optionally, of the rows matching each
+    dict of field values in ``filters``, e.g. ``register(Order, [{'status': 'paid'}])``.
+
+    Counters follow saves and deletes through signals. ``QuerySet.update()``,
+    ``bulk_update()`` and raw SQL bypass them; use ``bulk_create()`` from this module
+    and the ``reconcile_row_counts`` management command to account for those.
+    """
+    filter_list = _registry.setdefault(model, [{}])
+
+    for filters in filters or []:
+        if filters not in filter_list:
+            filter_list.append(dict(filters))
+
+    dispatch_uid = 'smart_pagination.counters:{}'.format(model._meta.label_lower)
+    post_init.connect(_post_init, sender=model, dispatch_uid=dispatch_uid)
+    post_save.connect(_post_save, sender=model, dispatch_uid=dispatch_uid)
+    post_delete.connect(_post_delete, sender=model, dispatch_uid=dispatch_uid)
+
+
+def unregister(model):
+    """
+    Stop maintaining the counters of ``model``. The stored counts are kept.
+    """
+    _registry.pop(model, None)
+
+    dispatch_uid = 'smart_pagination.counters:{}'.format(model._meta.label_lower)
+    post_init.disconnect(sender=model, dispatch_uid=dispatch_uid)
+    post_save.disconnect(sender=model, dispatch_uid=dispatch_uid)
+    post_delete.disconnect(sender=model, dispatch_uid=dispatch_uid)
+
+
+def bulk_create(model, objs, using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Run ``bulk_create()``, which sends no signals, and update the counters of ``model`` accordingly.
+    """
+    objs = model._default_manager.using(using).bulk_create(objs, **kwargs)
+
+    deltas = Counter()
+    for obj in objs:
+        deltas.update(_matching_keys(model, _snapshot(model, obj)))
+
+    for key, delta in deltas.items():
+        adjust(model, key, delta, using)
+
+    return objs
+
+
+def reconcile(models=None, using=DEFAULT_DB_ALIAS):
+    """
+    Recount the registered counters, fixing the drift caused by writes that bypass signals.
+    Return a list of ``(model, filter_key, old_count, new_count)`` for the counters that changed.
+    """
+    changes = []
+
+    for model in models or list(_registry):
+        for filters in _registry[model]:
+            key = filter_key(filters)
+            count = exact_count(model, filters, using)
+            counter, created = _row_counts(using).get_or_create(
+                model=model._meta.label_lower, filter_key=key, defaults={'count': count},
+            )
+
+            if not created and counter.count != count:
+                changes.append((model, key, counter.count, count))
+                _row_counts(using).filter(pk=counter.pk).update(count=count)
+
+    return changes
+
+
+class CounterPaginator(Paginator):
+    """
+    Paginator that reads the count from the counters maintained by ``register()``,
+    which must have been called for the model and the ``filters`` given.
+    The queryset is expected to be filtered by the same ``filters``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.filters = kwargs.pop('filters', None) or {}
+        super(CounterPaginator, self).__init__(*args, **kwargs)
+
+    @cached_property
+    def count(self):
+        model = self.object_list.model
+        using = self.object_list.db
+
+        if model not in _registry:
+            raise ImproperlyConfigured('Row counter of "{}" is not registered'.format(model._meta.label))
+
+        key = filter_key(self.filters)
+        _filters_for_key(model, key)
+
+        count = _row_counts(using).filter(
+            model=model._meta.label_lower, filter_key=key,
+        ).values_list('count', flat=True).first()
+
+        if count is None:
+            count = exact_count(model, self.filters, using)
+            _row_counts(using).get_or_create(
+                model=model._meta.label_lower, filter_key=key, defaults={'count': count},
+            )
+
+        return count
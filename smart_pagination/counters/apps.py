@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class CountersConfig(AppConfig):
+    name = 'smart_pagination.counters'
+    label = 'smart_pagination_counters'
+    verbose_name = 'Smart Pagination row counters'
+    default_auto_field = 'django.db.models.AutoField'
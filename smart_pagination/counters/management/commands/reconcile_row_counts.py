@@ -0,0 +1,35 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from .... import counters
+
+
+class Command(BaseCommand):
+    help = 'Recount the row counters maintained by smart_pagination.counters.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='*', metavar='app_label.ModelName',
+                            help='Restrict the reconciliation to these models.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS,
+                            help='Nominates a database to reconcile. Defaults to the "default" database.')
+
+    def handle(self, *labels, **options):
+        models = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+
+            if model not in counters._registry:
+                raise CommandError('Row counter of "{}" is not registered'.format(label))
+
+            models.append(model)
+
+        changes = counters.reconcile(models, using=options['database'])
+
+        for model, key, old_count, new_count in changes:
+            self.stdout.write('{} [{}]: {} -> {}'.format(model._meta.label, key, old_count, new_count))
+
+        self.stdout.write('Reconciled {} counter(s).'.format(len(changes)))
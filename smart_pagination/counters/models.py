@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class RowCount(models.Model):
+    """
+    Number of rows of a model, optionally restricted to the rows matching a set of field values.
+    Maintained by ``smart_pagination.counters``.
+    """
+
+    model = models.CharField(max_length=200)
+    filter_key = models.CharField(max_length=255, blank=True, default='')
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'smart_pagination_rowcount'
+        unique_together = ('model', 'filter_key')
+
+    def __str__(self):
+        return '{} [{}]: {}'.format(self.model, self.filter_key, self.count)
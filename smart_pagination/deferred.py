@@ -0,0 +1,23 @@
+from django.core.paginator import Paginator
+
+
+class DeferredJoinPaginator(Paginator):
+    """
+    Paginator that applies ``LIMIT/OFFSET`` to a query selecting only the primary keys,
+    which the database can answer from an index, and then loads the full rows of the
+    page with ``pk__in``. Deep pages no longer materialize every skipped row.
+
+    The rows keep the order of the queryset.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        rows = dict((obj.pk, obj) for obj in self.object_list.order_by().filter(pk__in=pks))
+
+        return self._get_page([rows[pk] for pk in pks if pk in rows], number, self)
@@ -6,7 +6,13 @@ MISSING_THIRD_ARG = 'Missing third argument (template variable name)'
 
 WRONG_FIRST_ARG = 'First parameter must be an instance of "{}"'.format(Page.__name__)
 WRONG_SECOND_ARG = 'Second parameter must be an instance of "{}"'.format(int.__name__)
+WRONG_FOURTH_ARG = 'Fourth parameter must be an instance of "{}"'.format(str.__name__)
 
 WRONG_ARGS = '"{{}}" requires an instance of "{}",' \
              ' the number of links to show' \
-             ' and, optionally, the "page_kwarg" name'.format(Page.__name__)
\ No newline at end of file
+             ' and, optionally, the "page_kwarg" name'.format(Page.__name__)
+
+WRONG_CACHE_OPTIONS = '"{}" accepts the "cache" timeout and, optionally,' \
+                      ' the "cache_alias", "cache_version", "cache_name" and "vary_on" options'
+
+UNKNOWN_THEME = 'Unknown pagination theme "{}"'
@@ -0,0 +1,206 @@
+import hashlib
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+OFFSET = struct.Struct('<Q')
+# Magic, inode of the file, length and SHA-1 of its first bytes, padded to a multiple of OFFSET.size
+HEADER = struct.Struct('<8sQQ20s4x')
+MAGIC = b'SPLINES1'
+HEAD_SIZE = 4096
+CHUNK_SIZE = 1024 * 1024
+
+
+def _head_digest(f, length):
+    f.seek(0)
+    return hashlib.sha1(f.read(length)).digest()
+
+
+class FileLines(object):
+    """
+    Lines of a large text file, like a log or an NDJSON file, that can be given to a
+    Django ``Paginator`` instead of a list.
+
+    The offsets where the lines start are kept in an index file, ``index_path`` or the
+    path of the file with ``.idx`` appended, and both files are read with ``mmap``, so
+    a page costs one read of its own lines whatever the size of the file. Only lines
+    ended by a newline are indexed. Lines are decoded with ``encoding`` and, when given,
+    passed to ``parser``, for example ``json.loads``.
+
+    The index records the inode and the first bytes of the file, so that a rotated file
+    is indexed again. It is updated under a lock on ``<index_path>.lock`` and replaced,
+    never truncated, so several processes can share it.
+    """
+
+    def __init__(self, path, index_path=None, encoding='utf-8', parser=None):
+        self.path = path
+        self.index_path = index_path or '{}.idx'.format(path)
+        self.encoding = encoding
+        self.parser = parser
+        self._index = self._data = None
+        self.refresh()
+
+    @contextmanager
+    def _locked(self):
+        # Without fcntl, as on Windows, the index should only be updated by one process
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.index_path + '.lock', 'ab') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _read_header(self):
+        # Return the inode, the head length, the head digest and the indexed end, or None for a missing or damaged index
+        try:
+            with open(self.index_path, 'rb') as index:
+                size = os.fstat(index.fileno()).st_size - HEADER.size
+                if size < OFFSET.size or size % OFFSET.size:
+                    return None
+
+                magic, inode, head_length, digest = HEADER.unpack(index.read(HEADER.size))
+                index.seek(-OFFSET.size, os.SEEK_END)
+                end = OFFSET.unpack(index.read(OFFSET.size))[0]
+        except OSError:
+            return None
+
+        if magic != MAGIC:
+            return None
+
+        return inode, head_length, digest, end
+
+    def refresh(self):
+        """
+        Index the lines appended to the file since the index was last updated. The index is
+        built again when the file is another one, as after a rotation, or is shorter than
+        what was indexed, as after a truncation.
+        """
+        with self._locked():
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                # Read after taking the lock, since another process may just have updated the index
+                header = self._read_header()
+
+                if header is None:
+                    self._rebuild(f, stat)
+                else:
+                    inode, head_length, digest, end = header
+
+                    if inode != stat.st_ino or end > stat.st_size or _head_digest(f, head_length) != digest:
+                        self._rebuild(f, stat)
+                    elif stat.st_size > end:
+                        self._append(f, stat, head_length, end)
+
+            self._map()
+
+    def _rebuild(self, f, stat):
+        # Readers may have the old index mapped, so a new one replaces it instead of truncating it
+        temp_path = '{}.{}.tmp'.format(self.index_path, os.getpid())
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+        try:
+            with os.fdopen(fd, 'wb') as index:
+                index.write(HEADER.pack(MAGIC, 0, 0, b''))
+                index.write(OFFSET.pack(0))
+                end = self._index_lines(f, index, 0, stat.st_size)
+
+                head_length = min(HEAD_SIZE, end)
+                index.seek(0)
+                index.write(HEADER.pack(MAGIC, stat.st_ino, head_length, _head_digest(f, head_length)))
+
+            os.replace(temp_path, self.index_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _append(self, f, stat, head_length, end):
+        with open(self.index_path, 'r+b') as index:
+            index.seek(0, os.SEEK_END)
+            end = self._index_lines(f, index, end, stat.st_size)
+
+            # The head of a small file grows with it, until HEAD_SIZE
+            if head_length < HEAD_SIZE and end > head_length:
+                head_length = min(HEAD_SIZE, end)
+                index.seek(0)
+                index.write(HEADER.pack(MAGIC, stat.st_ino, head_length, _head_digest(f, head_length)))
+
+    def _index_lines(self, f, index, position, size):
+        # Write the offsets of the lines ended after ``position`` and return the last one
+        end = position
+        f.seek(position)
+
+        while position < size:
+            chunk = f.read(min(CHUNK_SIZE, size - position))
+            if not chunk:
+                break
+
+            ends = []
+            i = chunk.find(b'\n')
+            while i != -1:
+                ends.append(position + i + 1)
+                i = chunk.find(b'\n', i + 1)
+
+            if ends:
+                index.write(struct.pack('<{}Q'.format(len(ends)), *ends))
+                end = ends[-1]
+
+            position += len(chunk)
+
+        return end
+
+    def _map(self):
+        self.close()
+
+        with open(self.index_path, 'rb') as index:
+            self._index = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._count = (len(self._index) - HEADER.size) // OFFSET.size - 1
+        end = self._offset(self._count)
+
+        if end > 0:
+            with open(self.path, 'rb') as f:
+                self._data = mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ)
+
+    def close(self):
+        for mapping in (self._index, self._data):
+            if mapping is not None:
+                mapping.close()
+        self._index = self._data = None
+
+    def _offset(self, line):
+        return OFFSET.unpack_from(self._index, HEADER.size + line * OFFSET.size)[0]
+
+    def _decode(self, line):
+        line = line.rstrip(b'\r').decode(self.encoding)
+        return self.parser(line) if self.parser is not None else line
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._count)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+
+            lines = self._data[self._offset(start):self._offset(stop)].split(b'\n')
+            return [self._decode(line) for line in lines[:-1]]
+
+        if key < 0:
+            key += self._count
+        if not 0 <= key < self._count:
+            raise IndexError('line index out of range')
+
+        return self._decode(self._data[self._offset(key):self._offset(key + 1) - 1])
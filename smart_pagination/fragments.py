@@ -0,0 +1,65 @@
+import hashlib
+
+from django.core.cache import caches
+
+KEY_PREFIX = 'smart_pagination:fragment'
+DEFAULT_CACHE_ALIAS = 'default'
+
+
+def _page_state(page):
+    if page is None:
+        return None
+    return page.number, page.is_current, page.url, getattr(page, 'cursor', None)
+
+
+def paginator_state(paginator):
+    """
+    Everything the links of ``paginator`` depend on, including the processed query string.
+    """
+    return (
+        _page_state(paginator.first),
+        _page_state(paginator.prev),
+        tuple(_page_state(page) for page in paginator.pages),
+        _page_state(paginator.next),
+        _page_state(paginator.last),
+        getattr(paginator, 'approximate', False),
+        getattr(paginator, 'query', ''),
+    )
+
+
+def default_fragment_name(template_name, lineno, source):
+    """
+    Name of a block that has no ``cache_name``: blocks of different templates, or at
+    different lines, never share their output, even when their source is the same.
+    """
+    state = repr((template_name, lineno, source))
+    return hashlib.sha1(state.encode('utf-8')).hexdigest()
+
+
+def fragment_cache_key(fragment_name, var_name, paginator, vary_on=()):
+    # Like the {% cache %} tag of Django, the vary_on values are keyed by their text
+    state = repr((var_name, paginator_state(paginator), tuple(str(value) for value in vary_on)))
+    digest = hashlib.sha1(state.encode('utf-8')).hexdigest()
+    return '{}:{}:{}'.format(KEY_PREFIX, fragment_name, digest)
+
+
+class FragmentCache(object):
+    """
+    Cache of the output of a ``{% paginate %}`` block. ``fragment_name`` tells apart the
+    blocks; the paginator state and the ``vary_on`` values tell apart the renders of a block.
+    """
+
+    def __init__(self, fragment_name, timeout, cache_alias=None, version=None):
+        self.fragment_name = fragment_name
+        self.timeout = timeout
+        self.cache = caches[cache_alias or DEFAULT_CACHE_ALIAS]
+        self.version = version
+
+    def key(self, var_name, paginator, vary_on=()):
+        return fragment_cache_key(self.fragment_name, var_name, paginator, vary_on)
+
+    def get(self, key):
+        return self.cache.get(key, version=self.version)
+
+    def set(self, key, output):
+        self.cache.set(key, output, self.timeout, version=self.version)
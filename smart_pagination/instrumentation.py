@@ -0,0 +1,163 @@
+import functools
+import logging
+import time
+
+from django.db import connections
+from django.utils.functional import cached_property
+
+# Callables that receive a Measurement; filled with add_observer. Nothing is measured while it is empty.
+observers = []
+
+
+def add_observer(observer):
+    if observer not in observers:
+        observers.append(observer)
+
+
+def remove_observer(observer):
+    if observer in observers:
+        observers.remove(observer)
+
+
+class Measurement(object):
+    """
+    Duration, in seconds, and number of queries of one step of the pagination: ``count``,
+    ``make_paginator`` or ``render``, or of a ``count_timeout``. ``page_count`` is ``None``
+    when it is not known; ``source`` tells which listing it comes from, when known.
+    """
+
+    def __init__(self, name, duration, queries, page_number, page_count, source=None):
+        self.name = name
+        self.duration = duration
+        self.queries = queries
+        self.page_number = page_number
+        self.page_count = page_count
+        self.source = source
+
+    def __repr__(self):
+        return '<Measurement {}: {:.6f}s, {} queries>'.format(self.name, self.duration, self.queries)
+
+
+class measure(object):
+    """
+    Context manager that reports the duration and the queries of its block to the observers.
+    """
+
+    def __init__(self, name, paginator=None, page_number=None):
+        self.name = name
+        self.paginator = paginator
+        self.page_number = page_number
+        self.queries = 0
+        self._start = None
+        self._wrappers = []
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        if not observers:
+            return self
+
+        for connection in connections.all():
+            wrapper = connection.execute_wrapper(self._count_query)
+            wrapper.__enter__()
+            self._wrappers.append(wrapper)
+
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._start is None:
+            return
+
+        duration = time.perf_counter() - self._start
+
+        for wrapper in reversed(self._wrappers):
+            wrapper.__exit__(None, None, None)
+        self._wrappers = []
+        self._start = None
+
+        if exc_type is None:
+            report(Measurement(self.name, duration, self.queries, self.page_number, _page_count(self.paginator)))
+
+
+def _page_count(paginator):
+    # Only paginators that already counted know it; counting here would add a query
+    if paginator is None or getattr(paginator, 'count_free', False) or 'count' not in paginator.__dict__:
+        return None
+
+    return paginator.num_pages
+
+
+def report(measurement):
+    for observer in list(observers):
+        observer(measurement)
+
+
+def measured(name):
+    """
+    Decorator of the functions that take a page as first argument, like ``make_paginator``.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(page_obj, *args, **kwargs):
+            if not observers:
+                return function(page_obj, *args, **kwargs)
+
+            with measure(name, page_obj.paginator, page_obj.number):
+                return function(page_obj, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class MeasuredCountMixin(object):
+    """
+    Report the count of a paginator to the observers. It must come before the paginator class:
+    ``class MyPaginator(MeasuredCountMixin, Paginator)``.
+    """
+
+    @cached_property
+    def count(self):
+        with measure('count', self):
+            return super(MeasuredCountMixin, self).count
+
+
+class LoggingObserver(object):
+    """
+    Observer that writes every measurement to a logger.
+    """
+
+    def __init__(self, logger='smart_pagination', level=logging.INFO):
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+
+    def __call__(self, measurement):
+        message = 'pagination %s took %.2f ms and %d queries (page %s of %s)'
+        args = [measurement.name, measurement.duration * 1000, measurement.queries,
+                measurement.page_number, measurement.page_count]
+
+        if measurement.source is not None:
+            message += ' in %s'
+            args.append(measurement.source)
+
+        self.logger.log(self.level, message, *args)
+
+
+class StatsdObserver(object):
+    """
+    Observer that sends the measurements to a statsd client, as the timer ``<prefix>.<name>``
+    in milliseconds and the counter ``<prefix>.<name>.queries``.
+    """
+
+    def __init__(self, client, prefix='smart_pagination', rate=1):
+        self.client = client
+        self.prefix = prefix
+        self.rate = rate
+
+    def __call__(self, measurement):
+        stat = '{}.{}'.format(self.prefix, measurement.name)
+        self.client.timing(stat, measurement.duration * 1000, rate=self.rate)
+        self.client.incr(stat + '.queries', measurement.queries, rate=self.rate)
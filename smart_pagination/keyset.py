@@ -0,0 +1,245 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Page as DjangoPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+from . import instrumentation, pagination
+
+FIRST = 'f'
+AFTER = 'a'
+BEFORE = 'b'
+LAST = 'l'
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+def encode_cursor(direction, values=None, number=None):
+    data = json.dumps([direction, values, number], cls=DjangoJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    if not cursor:
+        return FIRST, None, 1
+
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        data = base64.urlsafe_b64decode((cursor + padding).encode('ascii'))
+        direction, values, number = json.loads(data.decode('utf-8'))
+    except (TypeError, ValueError, UnicodeError, binascii.Error):
+        raise InvalidCursor('Invalid cursor')
+
+    # The cursor comes from the client, so anything that the paginator would not have made is rejected
+    if direction in (FIRST, LAST):
+        valid = values is None
+    elif direction in (AFTER, BEFORE):
+        valid = isinstance(values, list) and all(
+            isinstance(value, (str, int, float)) and not isinstance(value, bool) for value in values
+        )
+    else:
+        valid = False
+
+    if not valid or not (number is None or (isinstance(number, int) and not isinstance(number, bool))):
+        raise InvalidCursor('Invalid cursor')
+
+    return direction, values, number
+
+
+class KeysetPage(DjangoPage):
+    def __init__(self, object_list, number, paginator, cursor, next_cursor, previous_cursor):
+        super(KeysetPage, self).__init__(object_list, number, paginator)
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return '<Page {}>'.format(self.number if self.number is not None else '?')
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def next_page_number(self):
+        return self.number + 1 if self.number is not None else None
+
+    def previous_page_number(self):
+        return self.number - 1 if self.number is not None and self.number > 1 else None
+
+    def start_index(self):
+        if self.number is None or not self.object_list:
+            return None
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self):
+        start = self.start_index()
+        return start + len(self.object_list) - 1 if start is not None else None
+
+
+class KeysetPaginator(object):
+    """
+    Paginates an ordered queryset by seeking past the sort key of the last row
+    seen instead of using OFFSET, and never counts the rows.
+
+    The ordering fields must be non-null concrete fields of the model; the
+    primary key is appended when it is not already part of the ordering so
+    that every row has a unique position.
+    """
+
+    def __init__(self, object_list, per_page, ordering=None):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+
+        if ordering is None:
+            ordering = object_list.query.order_by or object_list.model._meta.ordering if object_list.ordered else ()
+        if not ordering:
+            raise ValueError('KeysetPaginator requires an ordered queryset')
+
+        fields = []
+        for field in ordering:
+            if not isinstance(field, str):
+                raise ValueError('KeysetPaginator only supports field names in the ordering')
+            descending = field.startswith('-')
+            fields.append((field.lstrip('-+'), descending))
+
+        pk_name = object_list.model._meta.pk.name
+        if not any(name in ('pk', pk_name) for name, descending in fields):
+            fields.append(('pk', fields[-1][1]))
+
+        self.fields = tuple(fields)
+        self.attnames = tuple(
+            name if name == 'pk' else object_list.model._meta.get_field(name).attname
+            for name, descending in self.fields
+        )
+
+    def _order_by(self, reverse=False):
+        return ['-' + name if descending != reverse else name for name, descending in self.fields]
+
+    def _seek(self, values, reverse=False, inclusive=False):
+        query = Q()
+        for i, (name, descending) in enumerate(self.fields):
+            lookup = '__lt' if descending != reverse else '__gt'
+            condition = Q(**{name + lookup: values[i]})
+            for previous_name, previous_value in zip(self.fields[:i], values[:i]):
+                condition &= Q(**{previous_name[0]: previous_value})
+            query |= condition
+
+        if inclusive:
+            query |= Q(**dict((name, value) for (name, descending), value in zip(self.fields, values)))
+
+        return query
+
+    def get_key(self, obj):
+        return [getattr(obj, attname) for attname in self.attnames]
+
+    def page(self, cursor=None):
+        direction, values, number = decode_cursor(cursor)
+
+        if values is not None and len(values) != len(self.fields):
+            raise InvalidCursor('Invalid cursor')
+
+        reverse = direction in (BEFORE, LAST)
+        queryset = self.object_list.order_by(*self._order_by(reverse))
+
+        if direction in (AFTER, BEFORE):
+            try:
+                queryset = queryset.filter(self._seek(values, reverse))
+            except (TypeError, ValueError, ValidationError):
+                # Values that the fields of the ordering cannot take
+                raise InvalidCursor('Invalid cursor')
+
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if reverse:
+            rows.reverse()
+
+        if direction in (FIRST, AFTER):
+            has_next, has_previous = has_more, direction == AFTER
+        else:
+            has_next, has_previous = direction == BEFORE, has_more
+
+        next_cursor = previous_cursor = None
+
+        if rows and has_next:
+            next_number = number + 1 if number is not None else None
+            next_cursor = encode_cursor(AFTER, self.get_key(rows[-1]), next_number)
+
+        if rows and has_previous:
+            previous_number = number - 1 if number is not None else None
+            previous_cursor = encode_cursor(BEFORE, self.get_key(rows[0]), previous_number)
+
+        return KeysetPage(rows, number, self, cursor or '', next_cursor, previous_cursor)
+
+
+class Page(pagination.Page):
+    __slots__ = ('cursor',)
+
+    def __init__(self, cursor, page_number, is_current=False, url_prefix=None):
+        object.__setattr__(self, 'is_current', is_current)
+        object.__setattr__(self, 'number', page_number)
+        object.__setattr__(self, 'is_approximate', False)
+        object.__setattr__(self, 'url', url_prefix + cursor if url_prefix is not None else None)
+        object.__setattr__(self, 'cursor', cursor)
+
+
+class Paginator(pagination.Paginator):
+    def __init__(self, first, prev, pages, next, last, url_prefix=None):
+        self._links = (first, prev, pages, next, last)
+        self.approximate = False
+        self.url_prefix = url_prefix
+
+    def to_dict(self):
+        """
+        Same as ``pagination.Paginator.to_dict``, with cursors instead of page numbers.
+        """
+        def cursor(page):
+            return page.cursor if page is not None else None
+
+        current = [page.cursor for page in self.pages if page.is_current][0]
+
+        return {
+            'window': [
+                cursor(self.first), cursor(self.prev), [page.cursor for page in self.pages],
+                cursor(self.next), cursor(self.last), current,
+            ],
+            'url_prefix': self.url_prefix,
+            'approximate': False,
+        }
+
+
+@instrumentation.measured('make_paginator')
+def make_paginator(page_obj, num_links, url_prefix=None):
+    number = page_obj.number
+
+    def make_page(cursor, page_number, is_current=False):
+        return Page(cursor, page_number, is_current, url_prefix)
+
+    prev_page = next_page = None
+
+    if page_obj.has_previous():
+        prev_page = make_page(page_obj.previous_cursor, page_obj.previous_page_number())
+
+    if page_obj.has_next():
+        next_page = make_page(page_obj.next_cursor, page_obj.next_page_number())
+    current_page = make_page(page_obj.cursor, number, is_current=True)
+
+    # Only the pages next to the current one can be reached without a count
+    pages = [current_page]
+    if next_page is not None and num_links > 1:
+        pages.append(next_page)
+    if prev_page is not None and num_links > 2:
+        pages.insert(0, prev_page)
+
+    first_page = make_page('', 1) if page_obj.has_previous() and number != 2 else None
+    last_page = make_page(encode_cursor(LAST), None) if page_obj.has_next() else None
+
+    return Paginator(first_page, prev_page, pages, next_page, last_page, url_prefix)
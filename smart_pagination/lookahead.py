@@ -0,0 +1,54 @@
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+
+
+class LookaheadPage(Page):
+    def __init__(self, object_list, number, paginator, has_next):
+        super(LookaheadPage, self).__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1 if self.object_list else 0
+
+
+class LookaheadPaginator(Paginator):
+    """
+    Paginator that never counts the rows: it fetches one row more than ``per_page``
+    to know whether there is a next page. ``make_paginator`` builds the links of its
+    pages up to the next page and without a last page.
+
+    ``orphans`` is not supported, since it depends on the number of rows.
+    """
+
+    count_free = True
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+
+        if not rows and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage('That page contains no results')
+
+        return LookaheadPage(rows[:self.per_page], number, self, len(rows) > self.per_page)
@@ -1,43 +1,142 @@
-import math, sys
-import django
+import math
+from functools import lru_cache
+from asgiref.sync import sync_to_async
+from django.core.paginator import Paginator as DjangoPaginator
 from django.http import QueryDict
+from django.utils.functional import cached_property
+from django.utils.html import escape
 
-PYTHON_2 = sys.version_info < (3,)
-DJANGO_GTE_18 = django.VERSION >= (1, 8)
+from . import instrumentation, serialization
+
+WINDOW_CACHE_SIZE = 4096
 
 
 class Page:
-    def __init__(self, current_page, page_number):
-        self.is_current = current_page == page_number
-        self.number = page_number
+    # Pages are shared between the paginators built from the same window, so they must not be changed
+    __slots__ = ('is_current', 'number', 'is_approximate', 'url')
+
+    def __init__(self, current_page, page_number, is_approximate=False, url_prefix=None):
+        object.__setattr__(self, 'is_current', current_page == page_number)
+        object.__setattr__(self, 'number', page_number)
+        object.__setattr__(self, 'is_approximate', is_approximate)
+        object.__setattr__(self, 'url', url_prefix + str(page_number) if url_prefix is not None else None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} objects are read-only'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} objects are read-only'.format(type(self).__name__))
+
+
+@lru_cache(maxsize=WINDOW_CACHE_SIZE)
+def _make_pages(first_page, prev_page, page_range, next_page, last_page, current_page, approximate):
+    # Only page numbers go in the key: the query strings of filtered listings would fill the cache and never hit
+    def make_page(page_number, is_approximate=False):
+        return Page(current_page, page_number, is_approximate) if page_number is not None else None
+
+    return (
+        make_page(first_page),
+        make_page(prev_page),
+        tuple(make_page(page_number) for page_number in page_range),
+        make_page(next_page),
+        make_page(last_page, approximate),
+    )
+
+
+def _with_url(page, url_prefix):
+    if page is None:
+        return None
+    return Page(page.number if page.is_current else None, page.number, page.is_approximate, url_prefix)
+
+
+def window_cache_info():
+    """
+    Return the hits, misses and size of the cache of the pages built by ``Paginator``.
+    """
+    return _make_pages.cache_info()
+
+
+def clear_window_cache():
+    _make_pages.cache_clear()
 
 
 class Paginator:
-    def __init__(self, first_page, prev_page, page_range, next_page, last_page, current_page):
-        pages = list()
-        for page_number in page_range:
-            pages.append(Page(current_page, page_number))
+    # Set on the links of pages whose paginator gave up counting, like BudgetPaginator
+    count_timed_out = False
+
+    def __init__(self, first_page, prev_page, page_range, next_page, last_page, current_page, approximate=False,
+                 url_prefix=None):
+        if not isinstance(page_range, range):
+            page_range = tuple(page_range)
+
+        self._pages = _make_pages(first_page, prev_page, page_range, next_page, last_page, current_page, approximate)
+        self.approximate = approximate
+        self.url_prefix = url_prefix
+        self._window = (first_page, prev_page, page_range, next_page, last_page, current_page)
+
+    @cached_property
+    def _links(self):
+        # The shared pages have no url, so the pages with the url of this paginator are built when first used
+        if self.url_prefix is None:
+            return self._pages
+
+        first, prev, pages, next, last = self._pages
+        return (
+            _with_url(first, self.url_prefix),
+            _with_url(prev, self.url_prefix),
+            tuple(_with_url(page, self.url_prefix) for page in pages),
+            _with_url(next, self.url_prefix),
+            _with_url(last, self.url_prefix),
+        )
+
+    first = property(lambda self: self._links[0])
+    prev = property(lambda self: self._links[1])
+    pages = property(lambda self: self._links[2])
+    next = property(lambda self: self._links[3])
+    last = property(lambda self: self._links[4])
+
+    @classmethod
+    def from_pages(cls, first, prev, pages, next, last, window, approximate=False, url_prefix=None):
+        """
+        Build a paginator from ``Page`` objects made elsewhere, with ``window`` the tuple
+        of page numbers ``(first, prev, page_range, next, last, current)`` they come from.
+        """
+        paginator = cls.__new__(cls)
+        paginator._links = (first, prev, pages, next, last)
+        paginator.approximate = approximate
+        paginator.url_prefix = url_prefix
+        paginator._window = window
+        return paginator
 
-        self.first = Page(current_page, first_page) if first_page is not None else None
-        self.prev = Page(current_page, prev_page) if prev_page is not None else None
-        self.pages = pages
-        self.next = Page(current_page, next_page) if next_page is not None else None
-        self.last = Page(current_page, last_page) if last_page is not None else None
+    def to_dict(self):
+        """
+        Return the links as ``window``, the compact array ``[first, prev, [pages...], next, last, current]``
+        of page numbers (``None`` for missing links), with the ``url_prefix`` the numbers are appended to.
+        """
+        first_page, prev_page, page_range, next_page, last_page, current_page = self._window
 
+        return {
+            'window': [first_page, prev_page, list(page_range), next_page, last_page, current_page],
+            'url_prefix': self.url_prefix,
+            'approximate': self.approximate,
+        }
+
+    def to_json(self):
+        return serialization.dumps(self.to_dict())
+
+
+@instrumentation.measured('make_paginator')
+def make_paginator(page_obj, num_links, url_prefix=None):
+    if getattr(page_obj.paginator, 'count_free', False):
+        return make_count_free_paginator(page_obj, num_links, url_prefix)
 
-def make_paginator(page_obj, num_links):
     number = page_obj.number
     page_count = len(page_obj.paginator.page_range)
 
     prev_page = page_obj.previous_page_number() if page_obj.has_previous() else None
     next_page = page_obj.next_page_number() if page_obj.has_next() else None
 
-    # Try to play nice with Python 2
-    # Force float division before math.ceil
-    middle_point = math.ceil(num_links / 2.0)
-    if PYTHON_2:
-        # Convert float to int
-        middle_point = int(middle_point)
+    middle_point = math.ceil(num_links / 2)
 
     first_page = page_obj.paginator.page_range[0] if page_count > num_links and number > middle_point else None
 
@@ -64,17 +163,181 @@ def make_paginator(page_obj, num_links):
 
         page_range = page_obj.paginator.page_range[start:end]
 
-    return Paginator(first_page, prev_page, page_range, next_page, last_page, number)
+    # Paginators that estimate the count, like ApproximateCountPaginator, flag it
+    approximate = getattr(page_obj.paginator, 'approximate', False)
+
+    return Paginator(first_page, prev_page, page_range, next_page, last_page, number, approximate, url_prefix)
+
+
+def make_count_free_paginator(page_obj, num_links, url_prefix=None):
+    """
+    Build the links of a page whose paginator does not know how many pages there are.
+    Only the pages up to the next one are known to exist, so the window ends there
+    and there is no last page.
+    """
+    number = page_obj.number
+
+    prev_page = page_obj.previous_page_number() if page_obj.has_previous() else None
+    next_page = page_obj.next_page_number() if page_obj.has_next() else None
+
+    end = next_page if next_page is not None else number
+    start = max(1, end - num_links + 1)
+
+    first_page = 1 if start > 1 else None
+
+    paginator = Paginator(first_page, prev_page, range(start, end + 1), next_page, None, number, url_prefix=url_prefix)
+
+    if getattr(page_obj.paginator, 'count_timed_out', False):
+        paginator.count_timed_out = True
+
+    return paginator
+
+
+async def _acount(paginator):
+    if 'count' in paginator.__dict__ or getattr(paginator, 'count_free', False):
+        return
+
+    if type(paginator).count is DjangoPaginator.count and hasattr(paginator.object_list, 'acount'):
+        if instrumentation.observers:
+            # The query is sent from the thread of sync_to_async, so it must be measured there
+            await sync_to_async(_measured_count)(paginator)
+        else:
+            paginator.__dict__['count'] = await paginator.object_list.acount()
+    else:
+        # Paginators with their own way of counting may still need the database
+        await sync_to_async(getattr)(paginator, 'count')
+
+
+def _measured_count(paginator):
+    with instrumentation.measure('count', paginator):
+        paginator.__dict__['count'] = paginator.object_list.count()
+
+
+async def amake_paginator(page_obj, num_links, url_prefix=None):
+    """
+    Same as ``make_paginator``, for async code: the count is made with ``QuerySet.acount()``
+    instead of blocking the event loop.
+    """
+    await _acount(page_obj.paginator)
+    return make_paginator(page_obj, num_links, url_prefix)
+
+
+async def apage(paginator, number):
+    """
+    Return the page ``number`` of ``paginator`` with its rows already fetched, so that
+    it can be used in async code.
+    """
+    await _acount(paginator)
+    page_obj = await sync_to_async(paginator.page)(number)
+
+    if hasattr(page_obj.object_list, 'aiterator'):
+        page_obj.object_list = [obj async for obj in page_obj.object_list]
+
+    return page_obj
+
+
+def _keyset_rows(keyset, chunk_size):
+    ordered = keyset.object_list.order_by(*keyset._order_by())
+    queryset = ordered
+
+    while True:
+        fetched, last = 0, None
+
+        for row in queryset[:chunk_size].iterator(chunk_size=chunk_size):
+            fetched, last = fetched + 1, row
+            yield row
+
+        if fetched < chunk_size:
+            return
+
+        queryset = ordered.filter(keyset._seek(keyset.get_key(last)))
+
+
+def iter_pages(queryset, per_page, num_links=10, url_prefix=None, ordering=None, chunk_size=2000):
+    """
+    Yield the Django page and the ``Paginator`` of the links of every page of ``queryset``,
+    in order, for exports and sitemaps that walk all the pages.
+
+    The rows are read in chunks of ``chunk_size`` that seek past the sort key of the last
+    row, as ``KeysetPaginator`` does, so no query uses ``OFFSET`` and only one page and
+    one chunk are in memory at a time. The rows are counted once, at the start, for the
+    last page of the links.
+    """
+    # The keyset module builds on this one, so it cannot be imported at the top
+    from .keyset import KeysetPaginator
+
+    keyset = KeysetPaginator(queryset, per_page, ordering)
+    paginator = DjangoPaginator(queryset.order_by(*keyset._order_by()), per_page)
+    paginator.count
+
+    number, rows = 0, []
+
+    def make_page(number, rows):
+        # Rows inserted since the count was made would leave the last pages out of the links
+        if (number - 1) * per_page + len(rows) > paginator.count:
+            paginator.__dict__['count'] = (number - 1) * per_page + len(rows)
+            paginator.__dict__.pop('num_pages', None)
+
+        page_obj = paginator._get_page(rows, number, paginator)
+        return page_obj, make_paginator(page_obj, num_links, url_prefix)
+
+    for row in _keyset_rows(keyset, chunk_size):
+        rows.append(row)
+
+        if len(rows) == per_page:
+            number += 1
+            yield make_page(number, rows)
+            rows = []
+
+    if rows:
+        yield make_page(number + 1, rows)
+
+
+def link_hints(paginator, prefetch=True):
+    """
+    Return the ``<link>`` tags of the previous and next pages of ``paginator``, and with
+    ``prefetch`` one that lets the browser fetch the next page ahead of the click.
+    Only pages with an URL, built from a ``page_kwarg``, have them.
+    """
+    links = []
+
+    if paginator.prev is not None and paginator.prev.url is not None:
+        links.append('<link rel="prev" href="{}">'.format(escape(paginator.prev.url)))
+
+    if paginator.next is not None and paginator.next.url is not None:
+        links.append('<link rel="next" href="{}">'.format(escape(paginator.next.url)))
+
+        if prefetch:
+            links.append('<link rel="prefetch" href="{}">'.format(escape(paginator.next.url)))
+
+    return ''.join(links)
 
 
 def process_querystring(request, page_kwarg):
-    if page_kwarg and (len(request.GET) > 0):
-        qs = request.GET.copy()
+    # Pages often render more than one paginator, so the result is kept on the request
+    processed = request.__dict__.setdefault('_smart_pagination_querystrings', {})
+
+    if page_kwarg not in processed:
+        processed[page_kwarg] = _process_querystring(request, page_kwarg)
+
+    return processed[page_kwarg]
+
 
-        if DJANGO_GTE_18 or not isinstance(qs, QueryDict):
-            new_qs = QueryDict('', mutable=True)
-            new_qs.update(qs)
-            qs = new_qs
+def make_url_prefix(query, page_kwarg):
+    """
+    Return the start of the links to the pages, to which only the page number (or cursor)
+    is added, or ``None`` if there is no ``page_kwarg`` to build the links with.
+    """
+    if not page_kwarg:
+        return None
+
+    return '?{}&{}='.format(query, page_kwarg) if query else '?{}='.format(page_kwarg)
+
+
+def _process_querystring(request, page_kwarg):
+    if page_kwarg and (len(request.GET) > 0):
+        qs = QueryDict('', mutable=True)
+        qs.update(request.GET)
 
         if page_kwarg in qs:
             qs.pop(page_kwarg)
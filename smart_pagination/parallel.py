@@ -0,0 +1,134 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import Paginator
+from django.db import connections
+
+MAX_WORKERS = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Connections opened by worker threads, closed by shutdown_executor()
+_worker_connections = set()
+
+
+def get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    return _executor
+
+
+def shutdown_executor():
+    """
+    Wait for the thread pool of ``get_executor()`` and close the connections of its threads.
+    """
+    global _executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+        worker_connections = list(_worker_connections)
+        _worker_connections.clear()
+
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+    for connection in worker_connections:
+        # The connection belongs to a worker thread
+        connection.inc_thread_sharing()
+        try:
+            connection.close()
+        finally:
+            connection.dec_thread_sharing()
+
+
+def _in_own_connection(function, queryset, *args):
+    # Queries run outside the request thread use the connection of the worker thread,
+    # which is kept as long as CONN_MAX_AGE allows, as Django does between requests
+    connection = connections[queryset.db]
+    connection.close_if_unusable_or_obsolete()
+
+    try:
+        return function(queryset, *args)
+    finally:
+        connection.close_if_unusable_or_obsolete()
+
+        if connection.connection is not None:
+            with _executor_lock:
+                _worker_connections.add(connection)
+
+
+def _count(queryset):
+    return queryset.count()
+
+
+def _rows(queryset, bottom, top):
+    return list(queryset[bottom:top]) if bottom is not None else []
+
+
+class ParallelPaginator(Paginator):
+    """
+    Paginator that runs the ``COUNT`` query and the query of the page rows at the same time.
+
+    ``page()`` sends the count to a thread pool, where it runs on its own database
+    connection, while the rows are fetched in the current thread. ``apage()`` does the
+    same for async views, running both queries outside the event loop. The rows are
+    fetched before the page number is validated, so a page past the end costs a query
+    that returns no rows.
+
+    Since the queries run on separate connections, the count does not see rows written
+    by an uncommitted transaction of the current thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.executor = kwargs.pop('executor', None)
+        super(ParallelPaginator, self).__init__(*args, **kwargs)
+
+    def _bounds(self, number):
+        # The count is not known yet, so the orphans of a possible last page are fetched as well
+        try:
+            bottom = (max(int(number), 1) - 1) * self.per_page
+        except (TypeError, ValueError):
+            return None, None
+        return bottom, bottom + self.per_page + self.orphans
+
+    def _build_page(self, number, rows):
+        number = self.validate_number(number)
+
+        if number * self.per_page + self.orphans < self.count:
+            rows = rows[:self.per_page]
+
+        return self._get_page(rows, number, self)
+
+    def _is_parallel(self):
+        return 'count' not in self.__dict__ and hasattr(self.object_list, 'query')
+
+    def page(self, number):
+        if not self._is_parallel():
+            return super(ParallelPaginator, self).page(number)
+
+        executor = self.executor or get_executor()
+        count = executor.submit(_in_own_connection, _count, self.object_list)
+        rows = _rows(self.object_list, *self._bounds(number))
+
+        self.__dict__['count'] = count.result()
+        return self._build_page(number, rows)
+
+    async def apage(self, number):
+        if not self._is_parallel():
+            return await sync_to_async(self.page)(number)
+
+        in_thread = sync_to_async(_in_own_connection, thread_sensitive=False)
+        count, rows = await asyncio.gather(
+            in_thread(_count, self.object_list),
+            in_thread(_rows, self.object_list, *self._bounds(number)),
+        )
+
+        self.__dict__['count'] = count
+        return self._build_page(number, rows)
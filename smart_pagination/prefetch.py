@@ -0,0 +1,89 @@
+import hashlib
+
+from django.core.cache import caches
+from django.core.paginator import Paginator
+
+from .parallel import _in_own_connection, get_executor
+
+KEY_PREFIX = 'smart_pagination:prefetch'
+
+
+def _warm(queryset, paginator, number):
+    cache = caches[paginator.cache_alias]
+    key = paginator.prefetch_key(number)
+
+    if cache.get(key) is None:
+        bottom, top = paginator._bounds(number)
+        cache.set(key, list(queryset.values_list('pk', flat=True)[bottom:top]), paginator.timeout)
+
+
+class PrefetchPaginator(Paginator):
+    """
+    Paginator that, after building a page, looks up the primary keys of the next page (and
+    of the previous one with ``prefetch_previous``) in the background and keeps them in a
+    Django cache. When that page is requested, its rows are fetched by primary key instead
+    of scanning past ``OFFSET`` rows.
+
+    The lookups run in a thread pool on their own database connections. Any object with
+    a ``submit(function, *args)`` method, like a task queue adapter, can be given as
+    ``executor`` instead. The cached keys expire after ``timeout`` seconds, since inserts
+    and deletes shift the rows of the pages.
+    """
+
+    cache_alias = 'default'
+    timeout = 60
+    prefetch_previous = False
+
+    def __init__(self, object_list, per_page, *args, **kwargs):
+        self.executor = kwargs.pop('executor', None)
+        for name in ('cache_alias', 'timeout', 'prefetch_previous'):
+            value = kwargs.pop(name, None)
+            if value is not None:
+                setattr(self, name, value)
+
+        super(PrefetchPaginator, self).__init__(object_list, per_page, *args, **kwargs)
+        self.prefetching = []
+
+    def prefetch_key(self, number):
+        # Unlike counts, the rows of a page depend on the ordering, so it is part of the key
+        sql, params = self.object_list.query.sql_with_params()
+        state = (self.object_list.db, sql, params, self.per_page, self.orphans)
+        digest = hashlib.sha1(repr(state).encode('utf-8')).hexdigest()
+        return '{}:{}:{}'.format(KEY_PREFIX, digest, number)
+
+    def _bounds(self, number):
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        return bottom, top
+
+    def prefetch(self, number):
+        """
+        Look up the primary keys of page ``number`` in the background, unless they are cached.
+        """
+        executor = self.executor or get_executor()
+        future = executor.submit(_in_own_connection, _warm, self.object_list, self, number)
+        self.prefetching.append(future)
+        return future
+
+    def page(self, number):
+        number = self.validate_number(number)
+
+        if not hasattr(self.object_list, 'query'):
+            return super(PrefetchPaginator, self).page(number)
+
+        pks = caches[self.cache_alias].get(self.prefetch_key(number))
+
+        if pks is not None:
+            rows = self.object_list.filter(pk__in=pks)
+        else:
+            bottom, top = self._bounds(number)
+            rows = self.object_list[bottom:top]
+
+        if number < self.num_pages:
+            self.prefetch(number + 1)
+        if self.prefetch_previous and number > 1:
+            self.prefetch(number - 1)
+
+        return self._get_page(rows, number, self)
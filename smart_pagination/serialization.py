@@ -0,0 +1,34 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data):
+    """
+    Serialize ``data`` to compact JSON bytes, with orjson when it is installed.
+    """
+    if orjson is not None:
+        # Dates and times go through DjangoJSONEncoder too, so the output does not depend on orjson
+        return orjson.dumps(data, default=DjangoJSONEncoder().default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+    return json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(paginator, results=None, **kwargs):
+    """
+    Return a JSON response with the links of ``paginator`` as ``pagination`` and,
+    when given, ``results`` as a list.
+    """
+    data = {'pagination': paginator.to_dict()}
+
+    if results is not None:
+        data['results'] = list(results)
+
+    kwargs.setdefault('content_type', 'application/json')
+    return HttpResponse(dumps(data), **kwargs)
@@ -0,0 +1,98 @@
+import heapq
+import itertools
+from operator import itemgetter
+
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from .cache import cached_count
+from .keyset import KeysetPaginator
+from .pagination import _keyset_rows
+from .parallel import _in_own_connection, get_executor
+
+CHUNK_SIZE = 1000
+
+
+class _MergeKey(object):
+    __slots__ = ('values', 'descending')
+
+    def __init__(self, values, descending):
+        self.values = values
+        self.descending = descending
+
+    def __lt__(self, other):
+        for value, other_value, descending in zip(self.values, other.values, self.descending):
+            if value != other_value:
+                return value > other_value if descending else value < other_value
+        return False
+
+
+def _count(queryset, cache_alias, timeout):
+    if cache_alias is None:
+        return queryset.count()
+    return cached_count(queryset, cache_alias, timeout)
+
+
+class ShardedPaginator(Paginator):
+    """
+    Numbered paginator over several querysets, usually the same query on different
+    databases (``queryset.using(alias)``), paginated as if they were one.
+
+    The count is the sum of the counts of the querysets, made at the same time in a
+    thread pool and, with ``cache_alias``, kept in a Django cache for ``timeout`` seconds.
+    The rows of a page come from a k-way merge of the querysets, each read in ordered
+    chunks that seek past the sort key of their last row, as ``KeysetPaginator`` does.
+    The ordering rules of ``KeysetPaginator`` apply and must be the same for every queryset.
+    """
+
+    cache_alias = None
+    timeout = 60
+
+    def __init__(self, querysets, per_page, *args, **kwargs):
+        ordering = kwargs.pop('ordering', None)
+        self.executor = kwargs.pop('executor', None)
+        for name in ('cache_alias', 'timeout'):
+            value = kwargs.pop(name, None)
+            if value is not None:
+                setattr(self, name, value)
+
+        querysets = list(querysets)
+        super(ShardedPaginator, self).__init__(querysets, per_page, *args, **kwargs)
+        self.keysets = [KeysetPaginator(queryset, per_page, ordering) for queryset in querysets]
+
+    @cached_property
+    def shard_counts(self):
+        executor = self.executor or get_executor()
+        futures = [
+            executor.submit(_in_own_connection, _count, queryset, self.cache_alias, self.timeout)
+            for queryset in self.object_list
+        ]
+        return [future.result() for future in futures]
+
+    @cached_property
+    def count(self):
+        return sum(self.shard_counts)
+
+    def _merged_rows(self, chunk_size):
+        if not self.keysets:
+            return iter(())
+
+        descending = [descending for name, descending in self.keysets[0].fields]
+
+        def stream(keyset):
+            for obj in _keyset_rows(keyset, chunk_size):
+                yield _MergeKey(keyset.get_key(obj), descending), obj
+
+        merged = heapq.merge(*[stream(keyset) for keyset in self.keysets], key=itemgetter(0))
+        return (obj for key, obj in merged)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        # No shard gives more than ``top`` rows to the page, so the chunks never need to be larger
+        rows = list(itertools.islice(self._merged_rows(max(min(top, CHUNK_SIZE), 1)), bottom, top))
+        return self._get_page(rows, number, self)
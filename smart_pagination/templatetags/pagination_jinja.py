@@ -1,14 +1,51 @@
 from django.core.paginator import Page
-from jinja2 import nodes
+from jinja2 import nodes, pass_context
 from jinja2.ext import Extension
 from jinja2.exceptions import TemplateSyntaxError, TemplateError
 
-from .. import pagination, error_messages as errors
+from markupsafe import Markup
+
+from .. import fragments, instrumentation, keyset, pagination, themes, error_messages as errors
+
+CACHE_OPTIONS = ('cache', 'cache_alias', 'cache_version', 'cache_name', 'vary_on')
+
+
+def _at_option(parser):
+    return parser.stream.current.type == 'name' and parser.stream.look().type == 'assign'
+
+
+def pagination_hints(paginator, prefetch=True):
+    return Markup(pagination.link_hints(paginator, prefetch))
+
+
+@pass_context
+def render_pagination(context, page_obj, num_links, page_kwarg='page', theme='plain'):
+    if not isinstance(theme, themes.Theme) and theme not in themes.THEMES:
+        raise TemplateError(errors.UNKNOWN_THEME.format(theme))
+
+    PaginationExtension._check_num_links(num_links)
+
+    # Async environments await the returned coroutine, so the count does not block the event loop
+    if context.environment.is_async:
+        return _arender_pagination(context.get('request'), page_obj, num_links, page_kwarg, theme)
+
+    paginator = PaginationExtension._make_paginator(context.get('request'), page_obj, num_links, page_kwarg)
+    return Markup(themes.render(paginator, theme))
+
+
+async def _arender_pagination(request, page_obj, num_links, page_kwarg, theme):
+    paginator = await PaginationExtension._amake_paginator(request, page_obj, num_links, page_kwarg)
+    return Markup(themes.render(paginator, theme))
 
 
 class PaginationExtension(Extension):
     tags = {'paginate'}
 
+    def __init__(self, environment):
+        super(PaginationExtension, self).__init__(environment)
+        environment.globals.setdefault('pagination_hints', pagination_hints)
+        environment.globals.setdefault('render_pagination', render_pagination)
+
     def parse(self, parser):
         lineno = next(parser.stream).lineno
 
@@ -24,38 +61,157 @@ class PaginationExtension(Extension):
 
         try:
             num_links = parser.parse_expression()
-            args.append(num_links)
         except TemplateSyntaxError:
             raise TemplateSyntaxError(errors.MISSING_SECOND_ARG, lineno)
 
+        # Literals are validated once here, other expressions on every render
+        if isinstance(num_links, nodes.Const):
+            if not isinstance(num_links.value, int) or isinstance(num_links.value, bool):
+                raise TemplateSyntaxError(errors.WRONG_SECOND_ARG, lineno)
+            args.append(num_links)
+        else:
+            args.append(self.call_method('_check_num_links', [num_links]))
+
         try:
             var_name = parser.parse_expression().name
         except TemplateSyntaxError:
             raise TemplateSyntaxError(errors.MISSING_THIRD_ARG, lineno)
 
-        try:
-            page_kwarg = parser.parse_expression()
-            args.append(page_kwarg)
-        except TemplateSyntaxError:
-            pass
+        if not _at_option(parser):
+            try:
+                page_kwarg = parser.parse_expression()
+                args.append(page_kwarg)
+            except TemplateSyntaxError:
+                pass
+            else:
+                if isinstance(page_kwarg, nodes.Const) and not isinstance(page_kwarg.value, str):
+                    raise TemplateSyntaxError(errors.WRONG_FOURTH_ARG, lineno)
+
+        cache_options = {}
+        while _at_option(parser):
+            option = next(parser.stream).value
+            next(parser.stream)
+
+            if option not in CACHE_OPTIONS:
+                raise TemplateSyntaxError(errors.WRONG_CACHE_OPTIONS.format('paginate'), lineno)
+
+            cache_options[option] = parser.parse_expression()
+
+        if cache_options and 'cache' not in cache_options:
+            raise TemplateSyntaxError(errors.WRONG_CACHE_OPTIONS.format('paginate'), lineno)
 
-        call_node = self.call_method('_make_paginator', args)
         body = parser.parse_statements(['name:endpaginate'], drop_needle=True)
+
+        if cache_options:
+            return self._cached_block(parser, args, var_name, cache_options, body, lineno)
+
+        # Async environments await the paginator, so the count does not block the event loop
+        method = '_amake_paginator' if self.environment.is_async else '_make_paginator'
+        call_node = self.call_method(method, args)
         body.insert(0, nodes.Assign(nodes.Name(var_name, 'store'), call_node))
         return body
 
+    def _cached_block(self, parser, args, var_name, cache_options, body, lineno):
+        fragment_name = fragments.default_fragment_name(parser.name, lineno, repr(body))
+
+        kwargs = [
+            nodes.Keyword('var_name', nodes.Const(var_name)),
+            nodes.Keyword('fragment_name', cache_options.get('cache_name', nodes.Const(fragment_name))),
+            nodes.Keyword('timeout', cache_options['cache']),
+            nodes.Keyword('cache_alias', cache_options.get('cache_alias', nodes.Const(None))),
+            nodes.Keyword('cache_version', cache_options.get('cache_version', nodes.Const(None))),
+            nodes.Keyword('vary_on', cache_options.get('vary_on', nodes.Const(None))),
+        ]
+
+        # The block is rendered as the caller, which receives the paginator, only on cache misses
+        method = '_arender_cached' if self.environment.is_async else '_render_cached'
+        call_node = self.call_method(method, args, kwargs)
+        return nodes.CallBlock(call_node, [nodes.Name(var_name, 'param')], [], body).set_lineno(lineno)
+
     @staticmethod
-    def _make_paginator(request, page_obj, num_links, page_kwarg=None):
+    def _check_page_obj(page_obj):
         if not isinstance(page_obj, Page):
             raise TemplateError(errors.WRONG_FIRST_ARG)
 
-        if not isinstance(num_links, int):
+    @staticmethod
+    def _check_num_links(num_links):
+        if not isinstance(num_links, int) or isinstance(num_links, bool):
             raise TemplateError(errors.WRONG_SECOND_ARG)
 
-        paginator = pagination.make_paginator(page_obj, num_links)
-        query = pagination.process_querystring(request, page_kwarg) if request else None
+        return num_links
+
+    @staticmethod
+    def _process_querystring(request, page_kwarg):
+        query = pagination.process_querystring(request, page_kwarg) if request else ''
+        return query, pagination.make_url_prefix(query, page_kwarg)
+
+    @staticmethod
+    def _make_paginator(request, page_obj, num_links, page_kwarg=None):
+        PaginationExtension._check_page_obj(page_obj)
+        query, url_prefix = PaginationExtension._process_querystring(request, page_kwarg)
+
+        if isinstance(page_obj, keyset.KeysetPage):
+            paginator = keyset.make_paginator(page_obj, num_links, url_prefix)
+        else:
+            paginator = pagination.make_paginator(page_obj, num_links, url_prefix)
+
+        if query:
+            paginator.query = query
+
+        return paginator
+
+    @staticmethod
+    async def _amake_paginator(request, page_obj, num_links, page_kwarg=None):
+        PaginationExtension._check_page_obj(page_obj)
+        query, url_prefix = PaginationExtension._process_querystring(request, page_kwarg)
+
+        if isinstance(page_obj, keyset.KeysetPage):
+            paginator = keyset.make_paginator(page_obj, num_links, url_prefix)
+        else:
+            paginator = await pagination.amake_paginator(page_obj, num_links, url_prefix)
 
         if query:
             paginator.query = query
 
         return paginator
+
+    @staticmethod
+    def _fragment_cache(paginator, var_name, fragment_name, timeout, cache_alias, cache_version, vary_on):
+        # vary_on is one value or a list of values, like [request.path, user.pk]
+        if vary_on is None:
+            vary_on = ()
+        elif not isinstance(vary_on, (list, tuple)):
+            vary_on = (vary_on,)
+
+        fragment_cache = fragments.FragmentCache(fragment_name, timeout, cache_alias, cache_version)
+        return fragment_cache, fragment_cache.key(var_name, paginator, vary_on)
+
+    @staticmethod
+    def _render_cached(request, page_obj, num_links, page_kwarg=None, caller=None, **options):
+        PaginationExtension._check_page_obj(page_obj)
+
+        with instrumentation.measure('render', page_obj.paginator, page_obj.number):
+            paginator = PaginationExtension._make_paginator(request, page_obj, num_links, page_kwarg)
+            fragment_cache, key = PaginationExtension._fragment_cache(paginator, **options)
+            output = fragment_cache.get(key)
+
+            if output is None:
+                output = caller(paginator)
+                fragment_cache.set(key, output)
+
+        return Markup(output)
+
+    @staticmethod
+    async def _arender_cached(request, page_obj, num_links, page_kwarg=None, caller=None, **options):
+        PaginationExtension._check_page_obj(page_obj)
+
+        with instrumentation.measure('render', page_obj.paginator, page_obj.number):
+            paginator = await PaginationExtension._amake_paginator(request, page_obj, num_links, page_kwarg)
+            fragment_cache, key = PaginationExtension._fragment_cache(paginator, **options)
+            output = fragment_cache.get(key)
+
+            if output is None:
+                output = await caller(paginator)
+                fragment_cache.set(key, output)
+
+        return Markup(output)
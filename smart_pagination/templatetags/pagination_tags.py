@@ -1,14 +1,81 @@
 from django.core.paginator import Page
 from django import template
 from django.template import TemplateSyntaxError
+from django.template.base import Variable, token_kwargs
+from django.utils.safestring import mark_safe
 
-from .. import pagination, error_messages as errors
+from .. import fragments, instrumentation, keyset, pagination, themes, error_messages as errors
 
 register = template.Library()
 
+CACHE_OPTIONS = ('cache', 'cache_alias', 'cache_version', 'cache_name', 'vary_on')
+
+
+def compile_num_links(parser, num_links):
+    expression = parser.compile_filter(num_links)
+    var = expression.var
+
+    if expression.filters or (isinstance(var, Variable) and var.literal is None):
+        return expression
+
+    # Literals are validated once here instead of on every render
+    value = var.literal if isinstance(var, Variable) else var
+
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TemplateSyntaxError(errors.WRONG_SECOND_ARG)
+
+    return value
+
+
+def resolve(expression, context):
+    # Like template.Variable, raise for missing variables instead of using "string_if_invalid"
+    if not expression.filters and isinstance(expression.var, Variable):
+        return expression.var.resolve(context)
+
+    return expression.resolve(context)
+
+
+def build_paginator(request, page_obj, num_links, page_kwarg):
+    query = pagination.process_querystring(request, page_kwarg) if request else ''
+    url_prefix = pagination.make_url_prefix(query, page_kwarg)
+
+    if isinstance(page_obj, keyset.KeysetPage):
+        paginator = keyset.make_paginator(page_obj, num_links, url_prefix)
+    else:
+        paginator = pagination.make_paginator(page_obj, num_links, url_prefix)
+
+    if query:
+        paginator.query = query
+
+    return paginator
+
 
 def paginate(parser, token):
     contents = token.split_contents()
+    cache_options = {}
+
+    for i, bit in enumerate(contents[1:], 1):
+        if '=' in bit and bit[0] not in '"\'':
+            contents, bits = contents[:i], contents[i:]
+            vary_on = []
+
+            # Like the {% cache %} tag, "vary_on" comes last and takes every value after it
+            for j, option in enumerate(bits):
+                if option.startswith('vary_on='):
+                    values = [option[len('vary_on='):]] + bits[j + 1:]
+                    vary_on = [parser.compile_filter(value) for value in values if value]
+                    bits = bits[:j]
+                    break
+
+            cache_options = token_kwargs(bits, parser)
+
+            if bits or set(cache_options) - set(CACHE_OPTIONS) or 'cache' not in cache_options:
+                raise TemplateSyntaxError(errors.WRONG_CACHE_OPTIONS.format(contents[0]))
+
+            if vary_on:
+                cache_options['vary_on'] = vary_on
+
+            break
 
     if len(contents) == 1:
         raise TemplateSyntaxError(errors.MISSING_FIRST_ARG)
@@ -24,51 +91,118 @@ def paginate(parser, token):
     else:
         raise TemplateSyntaxError(errors.WRONG_ARGS.format(contents[0]))
 
+    page_obj = parser.compile_filter(page_obj)
+    num_links = compile_num_links(parser, num_links)
+
     nodelist = parser.parse(('endpaginate',))
     parser.delete_first_token()
 
     var_name = var_name.strip('"\'')
     page_kwarg = page_kwarg.strip('"\'') if page_kwarg is not None else None
 
-    return PaginationNode(nodelist, page_obj, num_links, var_name, page_kwarg)
+    return PaginationNode(nodelist, page_obj, num_links, var_name, page_kwarg, cache_options)
 
 
 register.tag(paginate)
 
 
+@register.simple_tag(takes_context=True)
+def render_pagination(context, page_obj, num_links, page_kwarg='page', theme='plain'):
+    if not isinstance(page_obj, Page):
+        raise TemplateSyntaxError(errors.WRONG_FIRST_ARG)
+
+    if not isinstance(num_links, int) or isinstance(num_links, bool):
+        raise TemplateSyntaxError(errors.WRONG_SECOND_ARG)
+
+    if not isinstance(theme, themes.Theme) and theme not in themes.THEMES:
+        raise TemplateSyntaxError(errors.UNKNOWN_THEME.format(theme))
+
+    paginator = build_paginator(context.get('request', None), page_obj, num_links, page_kwarg)
+    return mark_safe(themes.render(paginator, theme))
+
+
+@register.simple_tag
+def pagination_hints(paginator, prefetch=True):
+    return mark_safe(pagination.link_hints(paginator, prefetch))
+
+
 class PaginationNode(template.Node):
-    def __init__(self, nodelist, page_obj, num_links, var_name, page_kwarg):
+    def __init__(self, nodelist, page_obj, num_links, var_name, page_kwarg, cache_options=None):
         self.nodelist = nodelist
         self.page_obj = page_obj
         self.num_links = num_links
         self.var_name = var_name
         self.page_kwarg = page_kwarg
+        self.cache_options = cache_options or {}
+        self._fragment_name = None
+
+    @property
+    def fragment_name(self):
+        # The parser sets the origin and the token of the node after building it
+        if self._fragment_name is None:
+            source = '\n'.join(
+                node.token.contents if getattr(node, 'token', None) is not None else repr(node)
+                for node in self.nodelist.get_nodes_by_type(template.Node)
+            )
+            origin = getattr(self, 'origin', None)
+            token = getattr(self, 'token', None)
+            self._fragment_name = fragments.default_fragment_name(
+                origin.name if origin is not None else None, token.lineno if token is not None else None, source,
+            )
+        return self._fragment_name
+
+    def get_fragment_cache(self, context):
+        if not self.cache_options:
+            return None, ()
+
+        options = dict(
+            (name, value.resolve(context)) for name, value in self.cache_options.items() if name != 'vary_on'
+        )
+        vary_on = [value.resolve(context) for value in self.cache_options.get('vary_on', ())]
+        fragment_cache = fragments.FragmentCache(
+            options.get('cache_name') or self.fragment_name, options['cache'],
+            options.get('cache_alias'), options.get('cache_version'),
+        )
+        return fragment_cache, vary_on
 
     def render(self, context):
-        request = context.get('request', None)
-
-        page_obj = template.Variable(self.page_obj).resolve(context)
+        page_obj = resolve(self.page_obj, context)
 
         if not isinstance(page_obj, Page):
             raise template.TemplateSyntaxError(errors.WRONG_FIRST_ARG)
 
-        try:
-            num_links = int(self.num_links)
-        except ValueError:
-            if self.num_links.startswith("'") or self.num_links.startswith('"'):
-                raise template.TemplateSyntaxError(errors.WRONG_SECOND_ARG)
+        if not instrumentation.observers:
+            return self._render(context, page_obj)
+
+        with instrumentation.measure('render', page_obj.paginator, page_obj.number):
+            return self._render(context, page_obj)
+
+    def _render(self, context, page_obj):
+        request = context.get('request', None)
+
+        num_links = self.num_links
 
-            num_links = template.Variable(self.num_links).resolve(context)
+        if not isinstance(num_links, int):
+            num_links = resolve(num_links, context)
 
             if not isinstance(num_links, int):
                 raise template.TemplateSyntaxError(errors.WRONG_SECOND_ARG)
 
-        query = pagination.process_querystring(request, self.page_kwarg) if request else None
-        paginator = pagination.make_paginator(page_obj, num_links)
+        paginator = build_paginator(request, page_obj, num_links, self.page_kwarg)
+
+        fragment_cache, vary_on = self.get_fragment_cache(context)
 
-        if query:
-            paginator.query = query
+        if fragment_cache is not None:
+            key = fragment_cache.key(self.var_name, paginator, vary_on)
+            output = fragment_cache.get(key)
+
+            if output is not None:
+                return output
 
         context.update({self.var_name: paginator})
+        output = self.nodelist.render(context)
+
+        if fragment_cache is not None:
+            fragment_cache.set(key, output)
 
-        return self.nodelist.render(context)
+        return output
@@ -0,0 +1,24 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class assert_max_queries(CaptureQueriesContext):
+    """
+    Context manager that fails when its block, like the render of a paginated template,
+    sends more than ``num`` queries to the database ``using``.
+    """
+
+    def __init__(self, num, using=DEFAULT_DB_ALIAS):
+        self.num = num
+        super(assert_max_queries, self).__init__(connections[using])
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super(assert_max_queries, self).__exit__(exc_type, exc_value, traceback)
+
+        if exc_type is not None or len(self) <= self.num:
+            return
+
+        queries = '\n'.join(
+            '{}. {}'.format(i, query['sql']) for i, query in enumerate(self.captured_queries, start=1)
+        )
+        raise AssertionError('{} queries executed, at most {} expected:\n{}'.format(len(self), self.num, queries))
@@ -0,0 +1,67 @@
+from django.utils.html import escape
+
+
+class Theme(object):
+    """
+    HTML of the links of a paginator. ``link`` and ``current`` are format strings of one
+    link, with the ``url`` and ``label`` fields; ``container`` wraps all of them.
+    """
+
+    def __init__(self, container, link, current, first='&laquo;', prev='&lsaquo;', next='&rsaquo;', last='&raquo;'):
+        self.container = container
+        self.link = link
+        self.current = current
+        self.labels = (first, prev, next, last)
+
+    def render(self, paginator):
+        first, prev, next, last = self.labels
+        links = []
+
+        def add(page, label):
+            if page is not None and page.url is not None:
+                links.append(self.link.format(url=escape(page.url), label=label))
+
+        add(paginator.first, first)
+        add(paginator.prev, prev)
+
+        for page in paginator.pages:
+            label = page.number if page.number is not None else ''
+            if page.is_current:
+                links.append(self.current.format(label=label))
+            else:
+                add(page, label)
+
+        add(paginator.next, next)
+        add(paginator.last, last)
+
+        return self.container.format(''.join(links))
+
+
+THEMES = {
+    'plain': Theme(
+        container='<nav class="pagination">{}</nav>',
+        link='<a href="{url}">{label}</a>',
+        current='<span class="current" aria-current="page">{label}</span>',
+    ),
+    'bootstrap': Theme(
+        container='<nav><ul class="pagination">{}</ul></nav>',
+        link='<li class="page-item"><a class="page-link" href="{url}">{label}</a></li>',
+        current='<li class="page-item active" aria-current="page"><span class="page-link">{label}</span></li>',
+    ),
+    'tailwind': Theme(
+        container='<nav class="flex items-center gap-1" aria-label="Pagination">{}</nav>',
+        link='<a class="px-3 py-1 rounded border border-gray-300 hover:bg-gray-100" href="{url}">{label}</a>',
+        current='<span class="px-3 py-1 rounded bg-blue-600 text-white" aria-current="page">{label}</span>',
+    ),
+}
+
+
+def render(paginator, theme='plain'):
+    """
+    Return the HTML of the links of ``paginator``, built with one of ``THEMES`` (or a ``Theme``).
+    The links need URLs, so the paginator must be made with a ``url_prefix``.
+    """
+    if not isinstance(theme, Theme):
+        theme = THEMES[theme]
+
+    return theme.render(paginator)
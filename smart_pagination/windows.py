@@ -0,0 +1,98 @@
+import math
+
+from .pagination import Page, Paginator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def iter_windows(page_count, num_links, url_prefix=None):
+    """
+    Yield the ``Paginator`` of every page from 1 to ``page_count``, the same that
+    ``make_paginator`` would build for each, without Django pages or paginators.
+
+    The window is moved along with the current page instead of being computed from
+    scratch. Only the current page differs between two windows, so the other pages
+    are shared by the windows they appear in, and none is kept in the cache of
+    ``make_paginator``.
+    """
+    middle_point = int(math.ceil(num_links / 2.0))
+    # Even windows have one more page after the current one than before it
+    after = middle_point - 1 if num_links % 2 == 1 else middle_point
+
+    head = range(1, min(num_links, page_count) + 1)
+    tail = range(max(page_count - num_links + 1, 1), page_count + 1)
+    has_edges = page_count > num_links
+
+    shared = {}
+
+    def get_page(page_number):
+        if page_number is None:
+            return None
+
+        page = shared.get(page_number)
+        if page is None:
+            page = shared[page_number] = Page(None, page_number, url_prefix=url_prefix)
+        return page
+
+    for number in range(1, page_count + 1):
+        prev_page = number - 1 if number > 1 else None
+        next_page = number + 1 if number < page_count else None
+
+        first_page = 1 if has_edges and number > middle_point else None
+        last_page = page_count if has_edges and number + after < page_count else None
+
+        if first_page is None:
+            page_range = head
+        elif last_page is None:
+            page_range = tail
+        else:
+            page_range = range(number - middle_point + 1, number + after + 1)
+
+        current = Page(number, number, url_prefix=url_prefix)
+        pages = tuple(current if page_number == number else get_page(page_number) for page_number in page_range)
+
+        yield Paginator.from_pages(
+            get_page(first_page), get_page(prev_page), pages, get_page(next_page), get_page(last_page),
+            (first_page, prev_page, page_range, next_page, last_page, number), url_prefix=url_prefix,
+        )
+
+        # The pages behind the window are not shown again, except the first one
+        if number - middle_point - 1 > 1:
+            shared.pop(number - middle_point - 1, None)
+
+
+def window_arrays(page_count, num_links):
+    """
+    Return the windows of every page from 1 to ``page_count`` as NumPy arrays, in a dict
+    with the ``number``, ``first``, ``prev``, ``start``, ``end`` (inclusive), ``next``
+    and ``last`` pages. Missing links are 0.
+    """
+    if numpy is None:
+        raise ImportError('window_arrays requires NumPy')
+
+    middle_point = int(math.ceil(num_links / 2.0))
+    after = middle_point - 1 if num_links % 2 == 1 else middle_point
+    has_edges = page_count > num_links
+
+    number = numpy.arange(1, page_count + 1, dtype=numpy.int64)
+    zero = numpy.zeros_like(number)
+
+    first = numpy.where(has_edges & (number > middle_point), 1, zero)
+    last = numpy.where(has_edges & (number + after < page_count), page_count, zero)
+
+    tail_start = max(page_count - num_links + 1, 1)
+    start = numpy.where(first == 0, 1, numpy.where(last == 0, tail_start, number - middle_point + 1))
+    end = numpy.where(first == 0, min(num_links, page_count), numpy.where(last == 0, page_count, number + after))
+
+    return {
+        'number': number,
+        'first': first,
+        'prev': number - 1,
+        'start': start,
+        'end': end,
+        'next': numpy.where(number < page_count, number + 1, zero),
+        'last': last,
+    }
@@ -0,0 +1,19 @@
+import pytest
+
+from .models import Item
+
+
+@pytest.fixture
+def make_items():
+    """
+    Return a function that creates one item for each of ``numbers`` on the ``using`` database,
+    named and placed by calling ``name`` and ``position`` with the number, and returns all the
+    items of that database.
+    """
+    def make_items(numbers=range(1, 51), name='item {}'.format, position=lambda i: i, using='default'):
+        Item.objects.using(using).bulk_create(
+            [Item(name=name(i), position=position(i)) for i in numbers], batch_size=5000,
+        )
+        return Item.objects.using(using).all()
+
+    return make_items
@@ -2,4 +2,25 @@ SECRET_KEY = 'secret-key'
 
 INSTALLED_APPS = (
     'smart_pagination',
+    'smart_pagination.counters',
+    'tests',
 )
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+    'other': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+}
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+    },
+]
+
+DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
@@ -0,0 +1,88 @@
+from django.db import connection
+import pytest
+
+from smart_pagination.approximate import ApproximateCountPaginator, _postgresql_estimate, estimate_count
+from smart_pagination.pagination import make_paginator
+
+pytestmark = pytest.mark.django_db
+
+
+class RecordingCursor(object):
+    def __init__(self, *rows):
+        self.rows = list(rows)
+        self.executed = []
+
+    def execute(self, sql, params):
+        self.executed.append((sql, params))
+
+    def fetchone(self):
+        return self.rows.pop(0)
+
+
+@pytest.fixture
+def items(make_items):
+    items = make_items()
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+    return items
+
+
+def test_estimate_count_uses_table_statistics(items):
+    assert estimate_count(items) == 50
+
+
+def test_estimate_count_is_none_for_filtered_queryset_on_sqlite(items):
+    assert estimate_count(items.filter(position__gt=10)) is None
+
+
+def test_estimate_above_threshold_is_approximate(items):
+    paginator = ApproximateCountPaginator(items, 5, threshold=10)
+
+    assert paginator.count == 50
+    assert paginator.approximate
+
+
+def test_estimate_below_threshold_is_exact(items):
+    paginator = ApproximateCountPaginator(items, 5, threshold=100)
+
+    assert paginator.count == 50
+    assert not paginator.approximate
+
+
+def test_filtered_queryset_falls_back_to_exact_count(items):
+    paginator = ApproximateCountPaginator(items.filter(position__gt=10), 5, threshold=10)
+
+    assert paginator.count == 40
+    assert not paginator.approximate
+
+
+def test_make_paginator_marks_last_page_as_approximate(items):
+    paging = make_paginator(ApproximateCountPaginator(items, 5, threshold=10).page(1), 5)
+
+    assert paging.approximate
+    assert paging.last.is_approximate
+    assert not paging.pages[0].is_approximate
+
+
+def test_postgresql_estimate_quotes_the_table_name(items):
+    cursor = RecordingCursor((50.0,))
+
+    assert _postgresql_estimate(items, cursor) == 50
+    assert cursor.executed == [
+        ('SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)', [connection.ops.quote_name('tests_item')]),
+    ]
+
+
+def test_postgresql_estimate_is_none_for_a_missing_table(items):
+    assert _postgresql_estimate(items, RecordingCursor(None)) is None
+    assert _postgresql_estimate(items, RecordingCursor((None,))) is None
+
+
+def test_postgresql_estimate_explains_the_query_for_its_database(items):
+    cursor = RecordingCursor(([{'Plan': {'Plan Rows': 40}}],))
+
+    assert _postgresql_estimate(items.using('other').filter(position__gt=10), cursor) == 40
+    sql, params = cursor.executed[0]
+    assert sql.startswith('EXPLAIN (FORMAT JSON) SELECT') and params == (10,)
@@ -0,0 +1,80 @@
+import asyncio
+
+from django.core.exceptions import SynchronousOnlyOperation
+from django.core.paginator import Paginator
+from django.test import AsyncRequestFactory
+from jinja2 import Environment
+import pytest
+
+from smart_pagination.cache import CachedCountPaginator
+from smart_pagination.lookahead import LookaheadPaginator
+from smart_pagination.pagination import amake_paginator, apage, make_paginator
+from smart_pagination.templatetags.pagination_jinja import PaginationExtension
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def items(make_items):
+    return make_items().order_by('position')
+
+
+def test_make_paginator_blocks_in_async_code(items):
+    async def render():
+        return make_paginator(Paginator(items, 5).page(1), 5)
+
+    with pytest.raises(SynchronousOnlyOperation):
+        asyncio.run(render())
+
+
+def test_amake_paginator(items):
+    async def render():
+        page_obj = await apage(Paginator(items, 5), 4)
+        return page_obj, await amake_paginator(page_obj, 5)
+
+    page_obj, paging = asyncio.run(render())
+
+    assert [item.position for item in page_obj.object_list] == [16, 17, 18, 19, 20]
+    assert [page.number for page in paging.pages] == [2, 3, 4, 5, 6]
+    assert paging.last.number == 10
+
+
+@pytest.mark.parametrize('paginator_class', [CachedCountPaginator, LookaheadPaginator])
+def test_amake_paginator_with_custom_paginators(items, paginator_class):
+    async def render():
+        return await amake_paginator(await apage(paginator_class(items, 5), 2), 5)
+
+    assert asyncio.run(render()).pages[1].is_current
+
+
+def test_jinja_async_environment(items):
+    env = Environment(extensions=[PaginationExtension], enable_async=True)
+    template = env.from_string(
+        "{% paginate page_obj 5 paging 'page' %}"
+        "{% for page in paging.pages %}{{ page.number }}{% endfor %}|{{ paging.query }}"
+        "{% endpaginate %}"
+    )
+
+    async def render():
+        page_obj = await apage(Paginator(items, 5), 1)
+        # Build a fresh page whose count is not known yet, as an async view would
+        page_obj.paginator = Paginator(items, 5)
+        request = AsyncRequestFactory().get('/', {'page': '1', 'term': 'value'})
+        return await template.render_async(page_obj=page_obj, request=request)
+
+    assert asyncio.run(render()) == '12345|term=value'
+
+
+def test_jinja_async_render_pagination(items):
+    env = Environment(extensions=[PaginationExtension], enable_async=True)
+    template = env.from_string("{{ render_pagination(page_obj, 5, 'page') }}")
+
+    async def render():
+        page_obj = await apage(Paginator(items, 5), 1)
+        page_obj.paginator = Paginator(items, 5)
+        request = AsyncRequestFactory().get('/', {'page': '1', 'term': 'value'})
+        return await template.render_async(page_obj=page_obj, request=request)
+
+    output = asyncio.run(render())
+    assert 'href="?term=value&amp;page=2"' in output
+    assert 'href="?term=value&amp;page=10"' in output
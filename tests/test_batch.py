@@ -0,0 +1,78 @@
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Count
+from django.template import Context, Template
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.approximate import ApproximateCountPaginator
+from smart_pagination.batch import batch_count, prepare_paginators
+from smart_pagination.pagination import make_paginator
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def items(make_items):
+    return make_items(name=lambda i: 'item {}'.format(i % 3))
+
+
+def test_batch_count(items):
+    querysets = [
+        items,
+        items.filter(name='item 0'),
+        items.filter(position__lte=10).order_by('-position'),
+        items.filter(position__gt=10).distinct(),
+        items.none(),
+        items.filter(position__gt=100),
+        items.values('name').annotate(total=Count('id')),
+        items[:12],
+    ]
+
+    with CaptureQueriesContext(connection) as queries:
+        counts = batch_count(*querysets)
+
+    assert len(queries) == 1
+    assert counts == [50, 16, 10, 40, 0, 0, 3, 12]
+
+
+def test_batch_count_selects_only_primary_keys(items):
+    with CaptureQueriesContext(connection) as queries:
+        batch_count(items, items.filter(name='item 0'), items.order_by('-position')[:12])
+
+    assert 'updated_at' not in queries[0]['sql']
+
+
+def test_prepare_paginators(items):
+    paginators = [Paginator(items, 5), Paginator(items.filter(name='item 1'), 5), Paginator(items[:12], 5)]
+
+    with CaptureQueriesContext(connection) as queries:
+        prepare_paginators(*paginators)
+        pagings = [make_paginator(paginator.page(1), 5) for paginator in paginators]
+
+    assert len(queries) == 1
+    assert [paginator.count for paginator in paginators] == [50, 17, 12]
+    assert [paging.pages[-1].number for paging in pagings] == [5, 4, 3]
+
+
+def test_prepare_paginators_skips_counted_and_custom_paginators(items):
+    counted = Paginator(items, 5)
+    counted.count
+    paginators = [counted, ApproximateCountPaginator(items, 5), Paginator(list(range(10)), 5), Paginator(items, 5)]
+
+    assert prepare_paginators(*paginators) == paginators[3:]
+
+
+def test_template_tag_uses_prepared_count(items):
+    paginator = Paginator(items, 5)
+    prepare_paginators(paginator)
+    template = Template(
+        '{% load pagination_tags %}{% paginate page_obj 3 paging %}'
+        '{% for page in paging.pages %}{{ page.number }}{% endfor %}{% endpaginate %}'
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        response = template.render(Context({'page_obj': paginator.page(2)}))
+
+    assert response == '123'
+    assert not queries
@@ -0,0 +1,84 @@
+import re
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.bookmarks import BookmarkPaginator
+from smart_pagination.pagination import make_paginator
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def items(make_items):
+    cache.clear()
+    return make_items(range(1, 201), position=lambda i: i // 3).order_by('-position', 'id')
+
+
+def offsets(queries):
+    return [int(offset) for q in queries for offset in re.findall(r'OFFSET (\d+)', q['sql'])]
+
+
+def test_pages_match_offset_pagination(items):
+    bookmarks = BookmarkPaginator(items, 7, interval=4)
+    paginator = Paginator(items, 7)
+
+    for number in [1, 3, 4, 5, 6, 12, 13, 29, 9, 29]:
+        assert list(bookmarks.page(number)) == list(paginator.page(number))
+
+
+def test_jump_seeks_from_nearest_bookmark(items):
+    paginator = BookmarkPaginator(items, 5, interval=10)
+    paginator.count
+    paginator.page(31)
+
+    with CaptureQueriesContext(connection) as queries:
+        page = list(BookmarkPaginator(items, 5, interval=10).page(37))
+
+    assert page == list(Paginator(items, 5).page(37))
+    assert max(offsets(queries)) < 50
+
+
+def test_cold_jump_offsets_at_most_one_interval(items):
+    with CaptureQueriesContext(connection) as queries:
+        page = list(BookmarkPaginator(items, 5, interval=10).page(37))
+
+    assert page == list(Paginator(items, 5).page(37))
+    assert max(offsets(queries)) <= 50
+
+
+def test_missing_bookmark_seeks_from_nearest_recorded(items):
+    BookmarkPaginator(items, 5, interval=10).get_bookmark(11)
+
+    with CaptureQueriesContext(connection) as queries:
+        page = list(BookmarkPaginator(items, 5, interval=10).page(37))
+
+    assert page == list(Paginator(items, 5).page(37))
+    # From bookmark 11 to 21 and 31, then to page 37
+    assert offsets(queries) == [50, 50, 30]
+
+
+def test_bookmarked_page_records_its_bookmark(items):
+    paginator = BookmarkPaginator(items, 5, interval=10)
+    page = list(paginator.page(21))
+
+    assert cache.get(paginator._bookmark_key(21)) == [page[0].position, page[0].id]
+
+
+def test_missing_bookmark_is_recorded(items):
+    paginator = BookmarkPaginator(items, 5, interval=10)
+
+    assert cache.get(paginator._bookmark_key(21)) is None
+    list(paginator.page(25))
+    first = Paginator(items, 5).page(21)[0]
+    assert cache.get(paginator._bookmark_key(21)) == [first.position, first.id]
+
+
+def test_make_paginator(items):
+    paging = make_paginator(BookmarkPaginator(items, 5, interval=10).page(25), 5)
+
+    assert [page.number for page in paging.pages] == [23, 24, 25, 26, 27]
+    assert paging.last.number == 40
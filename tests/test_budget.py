@@ -0,0 +1,124 @@
+import asyncio
+import functools
+
+from django.db import connection
+from django.http import Http404
+from django.template import Context, Template
+from django.views.generic import ListView
+import pytest
+
+from smart_pagination import budget, instrumentation
+from smart_pagination.budget import BudgetPaginator, CountTimeout, budget_count
+from smart_pagination.lookahead import LookaheadPage
+from smart_pagination.pagination import amake_paginator, apage, make_paginator
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def items(make_items):
+    # Filtered, so that SQLite scans the rows instead of reading the size of the table
+    return make_items(range(1, 3001)).filter(position__gt=0).order_by('position')
+
+
+def test_budget_count(items):
+    assert budget_count(items, 10) == 3000
+
+    with pytest.raises(CountTimeout):
+        budget_count(items, 0)
+
+    # The progress handler is removed afterwards
+    assert items.count() == 3000
+
+
+def test_count_within_budget(items):
+    paginator = BudgetPaginator(items, 10, budget=10)
+    page_obj = paginator.page(2)
+    paging = make_paginator(page_obj, 5)
+
+    assert paginator.count == 3000
+    assert not paginator.count_timed_out
+    assert not isinstance(page_obj, LookaheadPage)
+    assert paging.last.number == 300
+    assert not paging.count_timed_out
+
+
+def test_count_out_of_budget(items):
+    paginator = BudgetPaginator(items, 10, budget=0)
+    page_obj = paginator.page(2)
+    paging = make_paginator(page_obj, 5)
+
+    assert paginator.count is None
+    assert paginator.count_timed_out
+    assert isinstance(page_obj, LookaheadPage)
+    assert [item.position for item in page_obj] == list(range(11, 21))
+    assert [page.number for page in paging.pages] == [1, 2, 3]
+    assert paging.last is None
+    assert paging.count_timed_out
+
+
+def test_page_count_is_unknown_out_of_budget(items):
+    paginator = BudgetPaginator(items, 10, budget=0)
+
+    assert paginator.num_pages is None
+    assert paginator.page_range is None
+    assert paginator.page(300).number == 300
+
+    within_budget = BudgetPaginator(items, 10, budget=10)
+    assert within_budget.num_pages == 300
+    assert within_budget.page_range == range(1, 301)
+
+
+def test_last_page_is_not_found_out_of_budget(items):
+    view = ListView(paginator_class=functools.partial(BudgetPaginator, budget=0), kwargs={'page': 'last'})
+
+    with pytest.raises(Http404):
+        view.paginate_queryset(items, 10)
+
+
+def test_timeout_is_reported(items):
+    measurements = []
+    instrumentation.add_observer(measurements.append)
+
+    try:
+        BudgetPaginator(items, 10, budget=0).page(1)
+        BudgetPaginator(items, 10, budget=0, source='recent items').page(1)
+    finally:
+        instrumentation.remove_observer(measurements.append)
+
+    assert [(m.name, m.source) for m in measurements] == [
+        ('count_timeout', 'tests.item'), ('count_timeout', 'recent items'),
+    ]
+
+
+def test_template_tag(items):
+    template = Template(
+        '{% load pagination_tags %}{% paginate page_obj 5 paging %}'
+        '{% for page in paging.pages %}{{ page.number }} {% endfor %}'
+        '{% if paging.count_timed_out %}more{% else %}of {{ paging.last.number }}{% endif %}{% endpaginate %}'
+    )
+
+    assert template.render(Context({'page_obj': BudgetPaginator(items, 10, budget=10).page(4)})) == '2 3 4 5 6 of 300'
+    assert template.render(Context({'page_obj': BudgetPaginator(items, 10, budget=0).page(4)})) == '1 2 3 4 5 more'
+
+
+def test_async(items):
+    async def render(budget):
+        page_obj = await apage(BudgetPaginator(items, 10, budget=budget), 3)
+        return await amake_paginator(page_obj, 3)
+
+    assert asyncio.run(render(10)).last.number == 300
+    assert asyncio.run(render(0)).last is None
+
+
+def test_lists_are_counted_without_budget():
+    paginator = BudgetPaginator(list(range(100)), 10, budget=0)
+
+    assert paginator.count == 100
+    assert paginator.page(10).has_next() is False
+
+
+def test_other_backends_count_without_budget(items, monkeypatch):
+    monkeypatch.delitem(budget.COUNTERS, connection.vendor)
+
+    assert budget_count(items, 0) == 3000
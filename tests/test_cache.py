@@ -0,0 +1,97 @@
+import threading
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.cache import (
+    CachedCountPaginator, cached_count, count_cache_key, invalidate_count, invalidate_model, invalidate_on_change,
+)
+from smart_pagination.pagination import make_paginator
+from .models import Item
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def items(make_items):
+    cache.clear()
+    return make_items()
+
+
+def count_queries(queryset):
+    with CaptureQueriesContext(connection) as queries:
+        cached_count(queryset)
+    return len([q for q in queries if 'COUNT(' in q['sql'].upper()])
+
+
+def test_count_is_cached(items):
+    assert count_queries(items) == 1
+    assert count_queries(items) == 0
+    assert cached_count(items) == 50
+
+
+def test_key_ignores_ordering_but_not_filters(items):
+    assert count_cache_key(items, cache) == count_cache_key(items.order_by('-name'), cache)
+    assert count_cache_key(items, cache) != count_cache_key(items.filter(position__gt=1), cache)
+    assert count_cache_key(items.filter(position__gt=1), cache) != count_cache_key(items.filter(position__gt=2), cache)
+
+
+def test_invalidate_count(items):
+    cached_count(items)
+    invalidate_count(items)
+    assert count_queries(items) == 1
+
+
+def test_invalidate_model(items):
+    cached_count(items)
+    cached_count(items.filter(position__gt=10))
+    invalidate_model(Item)
+
+    assert count_queries(items) == 1
+    assert count_queries(items.filter(position__gt=10)) == 1
+
+
+def test_invalidate_on_change(items):
+    invalidate_on_change(Item)
+    assert cached_count(items) == 50
+
+    Item.objects.create(name='new', position=51)
+    assert cached_count(items) == 51
+
+
+def test_waits_for_count_being_computed(items):
+    key = count_cache_key(items, cache)
+    cache.set(key + ':lock', 1)
+    threading.Timer(0.1, cache.set, [key, 42]).start()
+
+    assert count_queries(items) == 0
+    assert cached_count(items) == 42
+
+
+def test_waiter_does_not_release_foreign_lock(items):
+    key = count_cache_key(items, cache)
+    cache.set(key + ':lock', 'holder')
+
+    assert cached_count(items, wait_timeout=0.1) == 50
+    assert cache.get(key + ':lock') == 'holder'
+
+
+def test_waiter_returns_stale_count(items):
+    cached_count(items)
+    invalidate_model(Item)
+    cache.set(count_cache_key(items, cache) + ':lock', 'holder')
+
+    assert count_queries(items) == 0
+    assert cached_count(items) == 50
+
+
+def test_paginator_uses_cached_count(items):
+    make_paginator(CachedCountPaginator(items, 5).page(1), 5)
+
+    with CaptureQueriesContext(connection) as queries:
+        paging = make_paginator(CachedCountPaginator(items, 5).page(2), 5)
+
+    assert not any('COUNT(' in q['sql'].upper() for q in queries)
+    assert paging.last.number == 10
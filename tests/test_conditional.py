@@ -0,0 +1,144 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.views.generic import ListView
+import pytest
+
+from smart_pagination.conditional import ConditionalPaginationMixin, condition_on_page, probe
+from .models import Item
+
+pytestmark = pytest.mark.django_db
+
+
+class ItemListView(ConditionalPaginationMixin, ListView):
+    model = Item
+    paginate_by = 5
+    last_modified_field = 'updated_at'
+
+    def render_to_response(self, context, **response_kwargs):
+        page_obj = context['page_obj']
+        return HttpResponse('{}/{} {}'.format(
+            page_obj.number, page_obj.paginator.num_pages, [item.position for item in page_obj],
+        ))
+
+
+class LastModifiedListView(ItemListView):
+    send_last_modified = True
+
+
+@condition_on_page(lambda request: Item.objects.filter(name=request.GET.get('name', '')), 5, 'updated_at')
+def item_list(request):
+    return HttpResponse('items')
+
+
+@pytest.fixture
+def items(make_items):
+    return make_items(name=lambda i: 'item {}'.format(i % 2))
+
+
+def test_probe(items):
+    count, last_modified = probe(items.filter(name='item 0'), 'updated_at')
+
+    assert count == 25
+    assert last_modified == max(item.updated_at for item in items)
+    assert probe(items.none()) == (0, None)
+
+
+def test_list_view_sets_validators(items):
+    request = RequestFactory().get('/items/', {'page': '2'})
+
+    with CaptureQueriesContext(connection) as queries:
+        response = ItemListView.as_view()(request)
+
+    assert response.status_code == 200
+    assert response.content == b'2/10 [6, 7, 8, 9, 10]'
+    assert response.has_header('ETag')
+    assert not response.has_header('Last-Modified')
+    # The probe counts the rows, so the paginator only fetches them
+    assert len(queries) == 2
+
+
+def test_list_view_not_modified(items):
+    response = ItemListView.as_view()(RequestFactory().get('/items/', {'page': '2'}))
+    request = RequestFactory().get('/items/', {'page': '2'}, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    with CaptureQueriesContext(connection) as queries:
+        response = ItemListView.as_view()(request)
+
+    assert response.status_code == 304
+    assert len(queries) == 1
+
+
+def test_list_view_if_modified_since(items):
+    response = LastModifiedListView.as_view()(RequestFactory().get('/items/'))
+    request = RequestFactory().get('/items/', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+
+    assert LastModifiedListView.as_view()(request).status_code == 304
+
+
+def test_if_modified_since_is_ignored_without_send_last_modified(items):
+    last_modified = LastModifiedListView.as_view()(RequestFactory().get('/items/'))['Last-Modified']
+    Item.objects.filter(position=1).delete()
+    request = RequestFactory().get('/items/', HTTP_IF_MODIFIED_SINCE=last_modified)
+
+    # The deleted row leaves the latest modification unchanged
+    assert ItemListView.as_view()(request).status_code == 200
+
+
+def test_etag_changes_with_rows_changed_in_place(items):
+    view = ItemListView.as_view()
+    etag = view(RequestFactory().get('/items/'))['ETag']
+    Item.objects.filter(position=1).update(name='changed', updated_at=timezone.now())
+    request = RequestFactory().get('/items/', HTTP_IF_NONE_MATCH=etag)
+
+    assert view(request).status_code == 200
+
+
+def test_last_modified_field_is_required(items):
+    class NoFieldListView(ItemListView):
+        last_modified_field = None
+
+    with pytest.raises(ImproperlyConfigured):
+        NoFieldListView.as_view()(RequestFactory().get('/items/'))
+
+    with pytest.raises(ImproperlyConfigured):
+        condition_on_page(Item.objects.all(), 5, None)
+
+
+def test_etag_changes_with_page_query_and_rows(items):
+    factory = RequestFactory()
+    view = ItemListView.as_view()
+
+    etags = set(view(factory.get('/items/', params))['ETag'] for params in (
+        {'page': '1'}, {'page': '2'}, {'page': '2', 'order': 'name'},
+    ))
+    assert len(etags) == 3
+
+    etag = view(factory.get('/items/'))['ETag']
+    Item.objects.filter(position=50).delete()
+    assert view(factory.get('/items/'))['ETag'] != etag
+
+
+def test_decorator(items):
+    factory = RequestFactory()
+
+    response = item_list(factory.get('/items/', {'name': 'item 1'}))
+    assert response.content == b'items'
+    assert response.has_header('ETag')
+    assert not response.has_header('Last-Modified')
+
+    request = factory.get('/items/', {'name': 'item 1'}, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert item_list(request).status_code == 304
+
+    request = factory.get('/items/', {'name': 'item 0'}, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert item_list(request).status_code == 200
+
+
+def test_decorator_ignores_unsafe_methods(items):
+    response = item_list(RequestFactory().post('/items/'))
+
+    assert response.status_code == 200
+    assert not response.has_header('ETag')
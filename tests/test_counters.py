@@ -0,0 +1,93 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination import counters
+from smart_pagination.counters.models import RowCount
+from smart_pagination.pagination import make_paginator
+from .models import Item
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def registered():
+    counters.register(Item, [{'name': 'special'}])
+    yield
+    counters.unregister(Item)
+
+
+def stored_count(filter_key=''):
+    return RowCount.objects.get(model='tests.item', filter_key=filter_key).count
+
+
+@pytest.fixture
+def items():
+    for i in range(1, 11):
+        Item.objects.create(name='special' if i % 2 else 'item', position=i)
+    return Item.objects.all()
+
+
+def test_counters_follow_saves_and_deletes(items):
+    assert stored_count() == 10
+    assert stored_count('name=special') == 5
+
+    Item.objects.filter(position=1).get().delete()
+    assert stored_count() == 9
+    assert stored_count('name=special') == 4
+
+
+def test_counters_follow_changed_filter_values(items):
+    item = Item.objects.get(position=2)
+    item.name = 'special'
+    item.save()
+    assert stored_count() == 10
+    assert stored_count('name=special') == 6
+
+    item.save()
+    assert stored_count('name=special') == 6
+
+
+def test_bulk_create(items):
+    counters.bulk_create(Item, [Item(name='special', position=11), Item(name='item', position=12)])
+
+    assert stored_count() == 12
+    assert stored_count('name=special') == 6
+
+
+def test_reconcile_fixes_drift(items):
+    Item.objects.filter(position__gt=8).update(name='special')
+    Item.objects.bulk_create([Item(name='item', position=11)])
+
+    changes = counters.reconcile([Item])
+
+    assert sorted((key, old, new) for model, key, old, new in changes) == [('', 10, 11), ('name=special', 5, 6)]
+    assert stored_count() == 11
+    assert stored_count('name=special') == 6
+
+
+def test_reconcile_command(items):
+    Item.objects.bulk_create([Item(name='item', position=11)])
+
+    call_command('reconcile_row_counts', 'tests.Item')
+
+    assert stored_count() == 11
+
+
+def test_paginator_reads_counter(items):
+    paginator = counters.CounterPaginator(Item.objects.filter(name='special'), 2, filters={'name': 'special'})
+
+    with CaptureQueriesContext(connection) as queries:
+        paging = make_paginator(paginator.page(1), 5)
+
+    assert paging.pages[-1].number == 3
+    assert not any('COUNT(' in q['sql'].upper() for q in queries)
+
+
+def test_paginator_with_unregistered_filters_should_fail(items):
+    paginator = counters.CounterPaginator(Item.objects.filter(position=1), 2, filters={'position': 1})
+
+    with pytest.raises(ImproperlyConfigured):
+        paginator.count
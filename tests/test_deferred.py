@@ -0,0 +1,55 @@
+import timeit
+
+from django.core.paginator import Paginator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.deferred import DeferredJoinPaginator
+from smart_pagination.pagination import make_paginator
+from .models import Item
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def create_items(make_items):
+    return lambda count: make_items(range(count), position=lambda i: count - i)
+
+
+def test_keeps_queryset_order(create_items):
+    create_items(50)
+    queryset = Item.objects.order_by('position')
+
+    for number in (1, 4, 10):
+        assert list(DeferredJoinPaginator(queryset, 5).page(number)) == list(Paginator(queryset, 5).page(number))
+
+
+def test_offset_applies_to_primary_keys_only(create_items):
+    create_items(50)
+    paginator = DeferredJoinPaginator(Item.objects.order_by('position'), 5)
+    paginator.count
+
+    with CaptureQueriesContext(connection) as queries:
+        page = paginator.page(3)
+
+    pk_query, rows_query = [q['sql'] for q in queries]
+    assert 'OFFSET' in pk_query and '"name"' not in pk_query
+    assert 'OFFSET' not in rows_query and ' IN (' in rows_query
+    assert make_paginator(page, 5).pages[2].is_current
+
+
+def test_deep_page_costs_about_the_same_as_shallow_page(create_items):
+    create_items(100010)
+    queryset = Item.objects.order_by('position')
+
+    def cost(paginator_class, number):
+        paginator = paginator_class(queryset, 10)
+        paginator.count
+        return min(timeit.repeat(lambda: list(paginator.page(number)), number=1, repeat=5))
+
+    shallow = cost(DeferredJoinPaginator, 10)
+    deep = cost(DeferredJoinPaginator, 10000)
+
+    assert deep < shallow * 5
+    assert deep < cost(Paginator, 10000)
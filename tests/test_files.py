@@ -0,0 +1,172 @@
+import json
+import multiprocessing
+import os
+
+from django.core.paginator import EmptyPage, Paginator
+from django.template import Context, Template
+from jinja2 import Environment
+import pytest
+
+from smart_pagination.files import HEADER, FileLines
+from smart_pagination.templatetags.pagination_jinja import PaginationExtension
+
+
+@pytest.fixture
+def log(tmp_path):
+    path = tmp_path / 'app.log'
+    path.write_bytes(''.join('line {}\n'.format(i) for i in range(1, 48)).encode('utf-8'))
+    return str(path)
+
+
+def test_lines(log):
+    lines = FileLines(log)
+
+    assert len(lines) == 47
+    assert lines[0] == 'line 1'
+    assert lines[-1] == 'line 47'
+    assert lines[10:13] == ['line 11', 'line 12', 'line 13']
+    assert lines[40:100] == ['line {}'.format(i) for i in range(41, 48)]
+    assert lines[0:6:2] == ['line 1', 'line 3', 'line 5']
+    assert lines[5:5] == []
+
+    with pytest.raises(IndexError):
+        lines[47]
+
+
+def test_paginator(log):
+    paginator = Paginator(FileLines(log), 10)
+
+    assert paginator.num_pages == 5
+    assert list(paginator.page(2)) == ['line {}'.format(i) for i in range(11, 21)]
+    assert list(paginator.page(5)) == ['line {}'.format(i) for i in range(41, 48)]
+
+    with pytest.raises(EmptyPage):
+        paginator.page(6)
+
+
+def test_index_is_persisted(log):
+    FileLines(log)
+    index_mtime = os.stat(log + '.idx').st_mtime_ns
+
+    lines = FileLines(log)
+
+    assert len(lines) == 47
+    assert os.stat(log + '.idx').st_mtime_ns == index_mtime
+    assert os.path.getsize(log + '.idx') == HEADER.size + 48 * 8
+
+
+def test_appended_lines_are_indexed(log):
+    lines = FileLines(log)
+
+    with open(log, 'ab') as f:
+        f.write(b'line 48\nline 49\nline 5')
+
+    lines.refresh()
+    assert len(lines) == 49
+    assert lines[-1] == 'line 49'
+
+    with open(log, 'ab') as f:
+        f.write(b'0\r\n')
+
+    lines.refresh()
+    assert lines[47:] == ['line 48', 'line 49', 'line 50']
+    assert os.path.getsize(log + '.idx') == HEADER.size + 51 * 8
+
+
+def test_truncated_file_is_indexed_again(log):
+    FileLines(log)
+
+    with open(log, 'wb') as f:
+        f.write(b'new 1\nnew 2\n')
+
+    lines = FileLines(log)
+    assert lines[:] == ['new 1', 'new 2']
+
+
+def test_rotated_file_is_indexed_again(log):
+    FileLines(log)
+
+    # A new file, already longer than the old one, takes its place
+    os.rename(log, log + '.1')
+    with open(log, 'wb') as f:
+        f.write(b''.join('rotated {}\n'.format(i).encode('utf-8') for i in range(1, 101)))
+
+    lines = FileLines(log)
+    assert len(lines) == 100
+    assert lines[0] == 'rotated 1'
+
+
+def test_rewritten_file_is_indexed_again(log):
+    FileLines(log)
+
+    # Same inode, new content longer than the old one
+    with open(log, 'r+b') as f:
+        f.write(b''.join('other {}\n'.format(i).encode('utf-8') for i in range(1, 101)))
+
+    assert FileLines(log)[0] == 'other 1'
+
+
+def test_rebuild_does_not_truncate_mapped_index(log):
+    lines = FileLines(log)
+
+    os.rename(log, log + '.1')
+    with open(log, 'wb') as f:
+        f.write(b'new 1\n')
+    FileLines(log)
+
+    # The index mapped before the rebuild is still whole
+    assert len(lines) == 47
+    assert lines[46] == 'line 47'
+
+
+def _open_lines(path):
+    lines = FileLines(path)
+    return len(lines), lines[150000]
+
+
+def test_concurrent_processes_share_the_index(tmp_path):
+    path = tmp_path / 'big.log'
+    path.write_bytes(b''.join('line {}\n'.format(i).encode('utf-8') for i in range(200000)))
+
+    with multiprocessing.get_context('fork').Pool(4) as pool:
+        results = pool.map(_open_lines, [str(path)] * 4)
+
+    assert results == [(200000, 'line 150000')] * 4
+    assert FileLines(str(path))[199999] == 'line 199999'
+    assert os.path.getsize(str(path) + '.idx') == HEADER.size + 200001 * 8
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'empty.log'
+    path.write_bytes(b'')
+
+    lines = FileLines(str(path), index_path=str(tmp_path / 'index'))
+
+    assert len(lines) == 0
+    assert lines[:10] == []
+    assert list(Paginator(lines, 10).page(1)) == []
+
+
+def test_ndjson(tmp_path):
+    path = tmp_path / 'events.ndjson'
+    path.write_text(''.join(json.dumps({'id': i, 'name': 'événement'}) + '\n' for i in range(30)), encoding='utf-8')
+
+    page_obj = Paginator(FileLines(str(path), parser=json.loads), 10).page(3)
+
+    assert page_obj[0] == {'id': 20, 'name': 'événement'}
+
+
+def test_template_tags(log):
+    page_obj = Paginator(FileLines(log), 10).page(3)
+
+    template = Template(
+        '{% load pagination_tags %}{% paginate page_obj 3 paging %}'
+        '{% for page in paging.pages %}{{ page.number }}{% endfor %}:{{ page_obj.0 }}{% endpaginate %}'
+    )
+    assert template.render(Context({'page_obj': page_obj})) == '234:line 21'
+
+    env = Environment(extensions=[PaginationExtension])
+    template = env.from_string(
+        '{% paginate page_obj 3 paging %}{% for page in paging.pages %}{{ page.number }}{% endfor %}{% endpaginate %}'
+    )
+    assert template.render(page_obj=page_obj, request=None) == '234'
@@ -0,0 +1,151 @@
+import asyncio
+
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.template import Context, Template, TemplateSyntaxError
+from django.template.base import Origin
+from jinja2 import DictLoader, Environment, TemplateSyntaxError as JinjaTemplateSyntaxError
+import pytest
+
+from smart_pagination.templatetags.pagination_jinja import PaginationExtension
+from .test_pagination import paginator
+
+BODY = '{% for page in paging.pages %}{{ page.number }}{% endfor %}|{{ paging.query }}|{{ marker }}'
+
+env = Environment(extensions=[PaginationExtension])
+async_env = Environment(extensions=[PaginationExtension], enable_async=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def django_render(args, number, marker, query=None):
+    template = Template('{% load pagination_tags %}{% paginate ' + args + ' %}' + BODY + '{% endpaginate %}')
+    request = HttpRequest()
+    request.GET.update(query or {})
+    return template.render(Context({'page_obj': paginator.page(number), 'marker': marker, 'request': request}))
+
+
+def jinja_render(args, number, marker, query=None, environment=env):
+    template = environment.from_string('{% paginate ' + args + ' %}' + BODY + '{% endpaginate %}')
+    request = HttpRequest()
+    request.GET.update(query or {})
+    context = {'page_obj': paginator.page(number), 'marker': marker, 'request': request}
+
+    if environment.is_async:
+        return asyncio.run(template.render_async(**context))
+
+    return template.render(**context)
+
+
+@pytest.mark.parametrize('render', [django_render, jinja_render])
+def test_output_is_cached(render):
+    assert render("page_obj 5 paging 'page' cache=60", 1, 'a') == '12345||a'
+    assert render("page_obj 5 paging 'page' cache=60", 1, 'b') == '12345||a'
+
+
+@pytest.mark.parametrize('render', [django_render, jinja_render])
+def test_key_depends_on_paginator_state_and_query(render):
+    render("page_obj 5 paging 'page' cache=60", 1, 'a')
+
+    assert render("page_obj 5 paging 'page' cache=60", 6, 'b') == '45678||b'
+    assert render("page_obj 4 paging 'page' cache=60", 1, 'b') == '1234||b'
+    assert render("page_obj 5 paging 'page' cache=60", 1, 'b', {'term': 'x'}) == '12345|term=x|b'
+
+
+@pytest.mark.parametrize('render', [django_render, jinja_render])
+def test_cache_version(render):
+    render("page_obj 5 paging cache=60 cache_version=1", 1, 'a')
+
+    assert render("page_obj 5 paging cache=60 cache_version=2", 1, 'b') == '12345||b'
+    assert render("page_obj 5 paging cache=60 cache_version=1", 1, 'b') == '12345||a'
+
+
+@pytest.mark.parametrize('render', [django_render, jinja_render])
+def test_without_cache_option_is_not_cached(render):
+    render('page_obj 5 paging', 1, 'a')
+
+    assert render('page_obj 5 paging', 1, 'b') == '12345||b'
+
+
+def test_async_jinja_environment():
+    jinja_render("page_obj 5 paging cache=60", 1, 'a', environment=async_env)
+
+    assert jinja_render("page_obj 5 paging cache=60", 1, 'b', environment=async_env) == '12345||a'
+
+
+BLOCK = '<a href="{{ base }}?page={{ paging.next.number }}">next</a>'
+
+
+def test_blocks_of_different_templates_are_not_shared():
+    source = '{% load pagination_tags %}{% paginate page_obj 5 paging cache=60 %}' + BLOCK + '{% endpaginate %}'
+    context = {'page_obj': paginator.page(1)}
+
+    products = Template(source, Origin('products.html'))
+    orders = Template(source, Origin('orders.html'))
+
+    assert products.render(Context(dict(context, base='/products/'))) == '<a href="/products/?page=2">next</a>'
+    assert orders.render(Context(dict(context, base='/orders/'))) == '<a href="/orders/?page=2">next</a>'
+
+
+def test_jinja_blocks_of_different_templates_are_not_shared():
+    source = '{% paginate page_obj 5 paging cache=60 %}' + BLOCK + '{% endpaginate %}'
+    environment = Environment(
+        extensions=[PaginationExtension], loader=DictLoader({'products.html': source, 'orders.html': source}),
+    )
+    context = {'page_obj': paginator.page(1), 'request': None}
+
+    products = environment.get_template('products.html').render(base='/products/', **context)
+    orders = environment.get_template('orders.html').render(base='/orders/', **context)
+
+    assert products == '<a href="/products/?page=2">next</a>'
+    assert orders == '<a href="/orders/?page=2">next</a>'
+
+
+@pytest.mark.parametrize('render, vary_on', [
+    (django_render, 'vary_on=marker'),
+    (django_render, 'vary_on=request.path marker'),
+    (jinja_render, 'vary_on=marker'),
+    (jinja_render, 'vary_on=[request.path, marker]'),
+])
+def test_vary_on(render, vary_on):
+    render('page_obj 5 paging cache=60 ' + vary_on, 1, 'a')
+
+    assert render('page_obj 5 paging cache=60 ' + vary_on, 1, 'b') == '12345||b'
+    assert render('page_obj 5 paging cache=60 ' + vary_on, 1, 'a') == '12345||a'
+
+
+def test_cache_name_is_shared_by_templates():
+    source = (
+        "{% load pagination_tags %}{% paginate page_obj 5 paging cache=60 cache_name='links' %}"
+        + BLOCK + '{% endpaginate %}'
+    )
+    context = {'page_obj': paginator.page(1)}
+
+    Template(source, Origin('products.html')).render(Context(dict(context, base='/products/')))
+    output = Template(source, Origin('orders.html')).render(Context(dict(context, base='/orders/')))
+
+    assert output == '<a href="/products/?page=2">next</a>'
+
+
+def test_jinja_cache_name_is_shared_by_templates():
+    source = "{% paginate page_obj 5 paging cache=60 cache_name='links' %}" + BLOCK + '{% endpaginate %}'
+    environment = Environment(
+        extensions=[PaginationExtension], loader=DictLoader({'products.html': source, 'orders.html': source}),
+    )
+    context = {'page_obj': paginator.page(1), 'request': None}
+
+    environment.get_template('products.html').render(base='/products/', **context)
+    output = environment.get_template('orders.html').render(base='/orders/', **context)
+
+    assert output == '<a href="/products/?page=2">next</a>'
+
+
+def test_unknown_option_should_fail():
+    with pytest.raises(TemplateSyntaxError):
+        Template('{% load pagination_tags %}{% paginate page_obj 5 paging timeout=60 %}{% endpaginate %}')
+
+    with pytest.raises(JinjaTemplateSyntaxError):
+        env.from_string('{% paginate page_obj 5 paging timeout=60 %}{% endpaginate %}')
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+
+from django.core.paginator import Paginator
+from django.template import Context, Template
+from jinja2 import Environment
+import pytest
+
+from smart_pagination import instrumentation
+from smart_pagination.instrumentation import LoggingObserver, MeasuredCountMixin, StatsdObserver
+from smart_pagination.pagination import amake_paginator, apage, make_paginator
+from smart_pagination.templatetags.pagination_jinja import PaginationExtension
+from smart_pagination.testing import assert_max_queries
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+class MeasuredPaginator(MeasuredCountMixin, Paginator):
+    pass
+
+
+class StatsdClient(object):
+    def __init__(self):
+        self.calls = []
+
+    def timing(self, stat, delta, rate=1):
+        self.calls.append(('timing', stat, rate))
+
+    def incr(self, stat, count=1, rate=1):
+        self.calls.append(('incr', stat, count, rate))
+
+
+@pytest.fixture
+def items(make_items):
+    return make_items().order_by('position')
+
+
+@pytest.fixture
+def measurements():
+    measurements = []
+    instrumentation.add_observer(measurements.append)
+    yield measurements
+    instrumentation.remove_observer(measurements.append)
+
+
+def test_nothing_is_measured_without_observers(items):
+    assert not instrumentation.observers
+
+    with instrumentation.measure('count') as measure:
+        Paginator(items, 5).count
+
+    assert measure.queries == 0
+
+
+def test_make_paginator(measurements):
+    make_paginator(Paginator(range(100), 10).page(4), 5)
+
+    assert [m.name for m in measurements] == ['make_paginator']
+    assert measurements[0].queries == 0
+    assert measurements[0].page_number == 4
+    assert measurements[0].page_count == 10
+    assert measurements[0].duration > 0
+
+
+def test_count(items, measurements):
+    paginator = MeasuredPaginator(items, 5)
+    paginator.page(2)
+    paginator.count
+
+    assert [(m.name, m.queries, m.page_count) for m in measurements] == [('count', 1, 10)]
+
+
+def test_async_count(items, measurements):
+    async def render():
+        return await amake_paginator(await apage(Paginator(items, 5), 1), 5)
+
+    asyncio.run(render())
+
+    assert [(m.name, m.queries, m.page_count) for m in measurements] == [('count', 1, 10), ('make_paginator', 0, 10)]
+
+
+def test_render_template(items, measurements):
+    template = Template(
+        '{% load pagination_tags %}{% paginate page_obj 5 paging %}'
+        '{% for item in page_obj %}{{ item.position }} {% endfor %}{% endpaginate %}'
+    )
+    page_obj = Paginator(items, 5).page(3)
+
+    response = template.render(Context({'page_obj': page_obj}))
+
+    assert response == '11 12 13 14 15 '
+    assert [(m.name, m.queries, m.page_number) for m in measurements] == [
+        ('make_paginator', 0, 3),
+        ('render', 1, 3),
+    ]
+
+
+def test_render_cached_jinja_block(measurements):
+    env = Environment(extensions=[PaginationExtension])
+    template = env.from_string('{% paginate page_obj 5 paging cache=60 %}{{ paging.pages|length }}{% endpaginate %}')
+
+    template.render(page_obj=Paginator(range(100), 10).page(4), request=None)
+
+    assert [m.name for m in measurements] == ['make_paginator', 'render']
+
+
+def test_logging_observer(caplog):
+    observer = LoggingObserver()
+    instrumentation.add_observer(observer)
+
+    try:
+        with caplog.at_level(logging.INFO, logger='smart_pagination'):
+            make_paginator(Paginator(range(100), 10).page(4), 5)
+    finally:
+        instrumentation.remove_observer(observer)
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith('pagination make_paginator took ')
+    assert caplog.records[0].getMessage().endswith(' ms and 0 queries (page 4 of 10)')
+
+
+def test_statsd_observer(items):
+    client = StatsdClient()
+    observer = StatsdObserver(client, prefix='app.pagination')
+    instrumentation.add_observer(observer)
+
+    try:
+        MeasuredPaginator(items, 5).count
+    finally:
+        instrumentation.remove_observer(observer)
+
+    assert client.calls == [('timing', 'app.pagination.count', 1), ('incr', 'app.pagination.count.queries', 1, 1)]
+
+
+def test_assert_max_queries(items):
+    template = Template(
+        '{% load pagination_tags %}{% paginate page_obj 5 paging %}'
+        '{% for item in page_obj %}{{ item.position }}{% endfor %}{% endpaginate %}'
+    )
+
+    with assert_max_queries(2):
+        template.render(Context({'page_obj': Paginator(items, 5).page(1)}))
+
+    with pytest.raises(AssertionError) as exc_info:
+        with assert_max_queries(1):
+            template.render(Context({'page_obj': Paginator(items, 5).page(1)}))
+
+    assert str(exc_info.value).startswith('2 queries executed, at most 1 expected:\n1. SELECT COUNT(*)')
+
+
+def test_logging_observer_with_source(caplog):
+    measurement = instrumentation.Measurement('count_timeout', 0.5, 1, None, None, 'tests.item')
+
+    with caplog.at_level(logging.INFO, logger='smart_pagination'):
+        LoggingObserver()(measurement)
+
+    assert caplog.records[0].getMessage() == (
+        'pagination count_timeout took 500.00 ms and 1 queries (page None of None) in tests.item'
+    )
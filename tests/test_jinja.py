@@ -173,28 +173,94 @@ def test_pagination_with_wrong_page_obj_should_fail():
 def test_pagination_with_str_num_links_should_fail():
     template_string = FORMAT_STRING.substitute(args="page_obj 'abc' paging")
 
-    request = HttpRequest()
+    with pytest.raises(TemplateSyntaxError):
+        env.from_string(template_string)
+
+
+def test_pagination_with_non_int_num_links_should_fail():
+    template_string = FORMAT_STRING.substitute(args="page_obj 2.5 paging")
+
+    with pytest.raises(TemplateSyntaxError):
+        env.from_string(template_string)
+
+
+def test_pagination_with_str_num_links_variable_should_fail():
+    template_string = FORMAT_STRING.substitute(args="page_obj num_links paging")
 
     tpl = env.from_string(template_string)
     ctx = {
         'page_obj': paginator.page(1),
-        'request': request,
+        'num_links': 'abc',
     }
 
     with pytest.raises(TemplateError):
         tpl.render(**ctx)
 
 
-def test_pagination_with_non_int_num_links_should_fail():
-    template_string = FORMAT_STRING.substitute(args="page_obj 2.5 paging")
+def test_pagination_with_non_str_page_kwarg_should_fail():
+    template_string = FORMAT_STRING.substitute(args="page_obj 5 paging 2")
+
+    with pytest.raises(TemplateSyntaxError):
+        env.from_string(template_string)
+
+
+def test_pagination_hints():
+    template_string = '''
+    {% paginate page_obj 3 paging 'page' %}{{ pagination_hints(paging) }}{% endpaginate %}
+    '''
+
+    request = HttpRequest()
+    request.GET.update({
+        'page': '2',
+        'term': 'value',
+    })
+
+    autoescape_env = Environment(extensions=[PaginationExtension], autoescape=True)
+    tpl = autoescape_env.from_string(template_string)
+    ctx = {
+        'page_obj': paginator.page(2),
+        'request': request,
+    }
+
+    response = tpl.render(**ctx)
+    assert (
+        '<link rel="prev" href="?term=value&amp;page=1">'
+        '<link rel="next" href="?term=value&amp;page=3">'
+        '<link rel="prefetch" href="?term=value&amp;page=3">'
+    ) in response
+
+
+def test_render_pagination():
+    template_string = "{{ render_pagination(page_obj, 3, 'page', theme='tailwind') }}"
 
     request = HttpRequest()
+    request.GET.update({
+        'page': '2',
+        'term': 'value',
+    })
 
-    tpl = env.from_string(template_string)
+    autoescape_env = Environment(extensions=[PaginationExtension], autoescape=True)
+    tpl = autoescape_env.from_string(template_string)
     ctx = {
-        'page_obj': paginator.page(1),
+        'page_obj': paginator.page(2),
         'request': request,
     }
 
+    response = tpl.render(**ctx)
+    assert response.startswith('<nav class="flex items-center gap-1" aria-label="Pagination">')
+    assert 'href="?term=value&amp;page=3">3</a>' in response
+
+
+@pytest.mark.parametrize('num_links', [True, '3'])
+def test_render_pagination_with_wrong_num_links_should_fail(num_links):
+    tpl = env.from_string("{{ render_pagination(page_obj, num_links) }}")
+
     with pytest.raises(TemplateError):
-        tpl.render(**ctx)
+        tpl.render(page_obj=paginator.page(1), num_links=num_links)
+
+
+def test_render_pagination_with_unknown_theme_should_fail():
+    tpl = env.from_string("{{ render_pagination(page_obj, 3, theme='unknown') }}")
+
+    with pytest.raises(TemplateError):
+        tpl.render(page_obj=paginator.page(1))
@@ -0,0 +1,142 @@
+from django.db import connection
+from django.http import HttpRequest
+from django.template import Context, Template
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.keyset import AFTER, BEFORE, FIRST, InvalidCursor, KeysetPaginator, encode_cursor, make_paginator
+from .models import Item
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def items(make_items):
+    return make_items(position=lambda i: i // 2)
+
+
+def names(page):
+    return [item.name for item in page]
+
+
+def test_first_page(items):
+    page = KeysetPaginator(items, 5).page()
+
+    assert names(page) == ['item 1', 'item 2', 'item 3', 'item 4', 'item 5']
+    assert page.number == 1
+    assert page.has_next()
+    assert not page.has_previous()
+
+
+def test_walk_forward_and_backward(items):
+    paginator = KeysetPaginator(items, 5)
+
+    page = paginator.page()
+    seen = names(page)
+    while page.has_next():
+        page = paginator.page(page.next_cursor)
+        seen.extend(names(page))
+
+    assert seen == ['item {}'.format(i) for i in range(1, 51)]
+    assert page.number == 10
+    assert not page.has_next()
+
+    page = paginator.page(page.previous_cursor)
+    assert names(page) == ['item 41', 'item 42', 'item 43', 'item 44', 'item 45']
+    assert page.number == 9
+    assert page.has_next()
+
+
+def test_descending_ordering(items):
+    paginator = KeysetPaginator(items.order_by('-position', '-id'), 5)
+    page = paginator.page(paginator.page().next_cursor)
+
+    assert names(page) == ['item 45', 'item 44', 'item 43', 'item 42', 'item 41']
+
+
+def test_last_page(items):
+    paginator = KeysetPaginator(items, 7)
+    page = paginator.page(make_paginator(paginator.page(), 5).last.cursor)
+
+    assert names(page) == ['item {}'.format(i) for i in range(44, 51)]
+    assert page.number is None
+    assert not page.has_next()
+    assert page.has_previous()
+
+
+def test_deep_page_does_not_count_or_offset(items):
+    paginator = KeysetPaginator(items, 5)
+    cursor = paginator.page(paginator.page().next_cursor).next_cursor
+
+    with CaptureQueriesContext(connection) as queries:
+        paginator.page(cursor)
+
+    assert len(queries) == 1
+    sql = queries[0]['sql'].upper()
+    assert 'COUNT(' not in sql
+    assert 'OFFSET' not in sql
+
+
+def test_invalid_cursor(items):
+    with pytest.raises(InvalidCursor):
+        KeysetPaginator(items, 5).page('not a cursor')
+
+
+@pytest.mark.parametrize('direction, values, number', [
+    (AFTER, None, 2),
+    (AFTER, 5, 2),
+    (AFTER, [1, 2], 'x'),
+    (BEFORE, [1, {}], 2),
+    (BEFORE, [1, 2], True),
+    (FIRST, [1, 2], 1),
+    (AFTER, ['x', 2], 2),
+    ('z', None, 1),
+])
+def test_forged_cursor(items, direction, values, number):
+    with pytest.raises(InvalidCursor):
+        KeysetPaginator(items, 5).page(encode_cursor(direction, values, number))
+
+
+def test_unordered_queryset_should_fail():
+    with pytest.raises(ValueError):
+        KeysetPaginator(Item.objects.order_by(), 5)
+
+
+def test_empty_ordering_should_fail(items):
+    with pytest.raises(ValueError):
+        KeysetPaginator(items, 5, ordering=[])
+
+
+def test_make_paginator(items):
+    paginator = KeysetPaginator(items, 5)
+    page = paginator.page(paginator.page(paginator.page().next_cursor).next_cursor)
+    paging = make_paginator(page, 5)
+
+    assert [p.number for p in paging.pages] == [2, 3, 4]
+    assert paging.pages[1].is_current
+    assert paging.first.number == 1
+    assert paging.first.cursor == ''
+    assert paging.prev.cursor == page.previous_cursor
+    assert paging.next.cursor == page.next_cursor
+    assert paging.last is not None
+
+    with pytest.raises(AttributeError):
+        paging.first.cursor = page.next_cursor
+    with pytest.raises(AttributeError):
+        paging.first.number = 2
+
+
+def test_template_tag(items):
+    template = Template(
+        '{% load pagination_tags %}'
+        '{% paginate page_obj 5 paging "cursor" %}'
+        '{% for page in paging.pages %}{{ page.number }}{% endfor %}|{{ paging.next.cursor }}|{{ paging.query }}'
+        '{% endpaginate %}'
+    )
+
+    request = HttpRequest()
+    request.GET.update({'cursor': 'abc', 'term': 'value'})
+    page = KeysetPaginator(items, 5).page()
+
+    response = template.render(Context({'page_obj': page, 'request': request}))
+    assert response == '12|{}|term=value'.format(page.next_cursor)
@@ -0,0 +1,73 @@
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.template import Context, Template
+from django.test.utils import CaptureQueriesContext
+from jinja2 import Environment
+import pytest
+
+from smart_pagination.lookahead import LookaheadPaginator
+from smart_pagination.pagination import make_paginator
+from smart_pagination.templatetags.pagination_jinja import PaginationExtension
+from .models import Item
+
+paginator = LookaheadPaginator(range(1, 51), 5)
+
+TEMPLATE = '{% for page in paging.pages %}{{ page.number }}{% endfor %}|{{ paging.last }}'
+
+
+def test_has_next():
+    assert paginator.page(9).has_next()
+    assert not paginator.page(10).has_next()
+    assert list(paginator.page(10)) == [46, 47, 48, 49, 50]
+
+
+def test_page_beyond_the_end_should_fail():
+    with pytest.raises(EmptyPage):
+        paginator.page(11)
+
+
+def test_window_ends_at_next_page():
+    paging = make_paginator(paginator.page(6), 5)
+
+    assert [page.number for page in paging.pages] == [3, 4, 5, 6, 7]
+    assert paging.pages[3].is_current
+    assert paging.first.number == 1
+    assert paging.prev.number == 5
+    assert paging.next.number == 7
+    assert paging.last is None
+
+
+def test_window_on_first_and_last_pages():
+    paging = make_paginator(paginator.page(1), 5)
+    assert [page.number for page in paging.pages] == [1, 2]
+    assert paging.first is None
+    assert paging.prev is None
+
+    paging = make_paginator(paginator.page(10), 5)
+    assert [page.number for page in paging.pages] == [6, 7, 8, 9, 10]
+    assert paging.next is None
+    assert paging.last is None
+
+
+@pytest.mark.django_db
+def test_does_not_count(make_items):
+    make_items()
+
+    with CaptureQueriesContext(connection) as queries:
+        make_paginator(LookaheadPaginator(Item.objects.all(), 5).page(3), 5)
+
+    assert len(queries) == 1
+    assert 'COUNT(' not in queries[0]['sql'].upper()
+
+
+def test_template_tag():
+    template = Template('{% load pagination_tags %}{% paginate page_obj 5 paging %}' + TEMPLATE + '{% endpaginate %}')
+
+    assert template.render(Context({'page_obj': paginator.page(2)})) == '123|None'
+
+
+def test_jinja_extension():
+    env = Environment(extensions=[PaginationExtension])
+    template = env.from_string('{% paginate page_obj 5 paging %}' + TEMPLATE + '{% endpaginate %}')
+
+    assert template.render(page_obj=paginator.page(2)) == '123|None'
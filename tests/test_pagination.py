@@ -1,6 +1,6 @@
 from django.core.paginator import Paginator
 import pytest
-from smart_pagination.pagination import make_paginator
+from smart_pagination.pagination import clear_window_cache, make_paginator, make_url_prefix, window_cache_info
 
 even_num_links = 6
 odd_num_links = 5
@@ -105,3 +105,62 @@ def test_next_page_is_not_none_when_there_is_next_page():
     paging = make_paginator(page, odd_num_links)
 
     assert paging.next is not None
+
+
+def test_windows_are_shared():
+    clear_window_cache()
+    paging = make_paginator(paginator.page(4), odd_num_links)
+    other = make_paginator(paginator.page(4), odd_num_links)
+
+    assert paging is not other
+    assert paging.pages is other.pages
+    assert paging.last is other.last
+    assert window_cache_info().hits == 1
+    assert window_cache_info().misses == 1
+
+
+@pytest.mark.parametrize('name', ['is_current', 'number', 'is_approximate', 'url', 'other'])
+def test_shared_pages_are_read_only(name):
+    page = make_paginator(paginator.page(4), odd_num_links).pages[0]
+
+    with pytest.raises(AttributeError):
+        setattr(page, name, True)
+    with pytest.raises(AttributeError):
+        delattr(page, name)
+    assert page.number == 2 and not page.is_current
+
+
+def test_windows_differ_by_current_page():
+    paging = make_paginator(paginator.page(4), odd_num_links)
+    other = make_paginator(paginator.page(5), odd_num_links)
+
+    assert paging.pages is not other.pages
+    assert [page.number for page in paging.pages if page.is_current] == [4]
+
+
+def test_page_urls():
+    paging = make_paginator(paginator.page(4), odd_num_links, '?q=a&page=')
+
+    assert [page.url for page in paging.pages] == ['?q=a&page={}'.format(number) for number in range(2, 7)]
+    assert paging.first.url == '?q=a&page=1'
+    assert paging.last.url == '?q=a&page=10'
+
+
+def test_windows_are_shared_between_query_strings():
+    clear_window_cache()
+    pagings = [make_paginator(paginator.page(4), odd_num_links, '?q={}&page='.format(i)) for i in range(100)]
+
+    assert [page.url for page in pagings[-1].pages] == ['?q=99&page={}'.format(number) for number in range(2, 7)]
+    assert pagings[0].pages[2].url == '?q=0&page=4' and pagings[0].pages[2].is_current
+    assert window_cache_info().currsize == 1
+    assert window_cache_info().hits == 99
+
+
+def test_page_urls_without_url_prefix():
+    assert make_paginator(paginator.page(4), odd_num_links).pages[0].url is None
+
+
+def test_make_url_prefix():
+    assert make_url_prefix('q=a', 'page') == '?q=a&page='
+    assert make_url_prefix('', 'page') == '?page='
+    assert make_url_prefix('q=a', None) is None
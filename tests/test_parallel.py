@@ -0,0 +1,74 @@
+import asyncio
+import threading
+
+from django.core.paginator import EmptyPage, Paginator
+from django.db import connections
+import pytest
+
+from smart_pagination import parallel
+from smart_pagination.pagination import make_paginator
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def items(make_items):
+    return make_items().order_by('position')
+
+
+def test_page_matches_paginator(items):
+    for number in (1, 5, 10):
+        assert list(parallel.ParallelPaginator(items, 5).page(number)) == list(Paginator(items, 5).page(number))
+
+
+def test_last_page_with_orphans(items):
+    page = parallel.ParallelPaginator(items, 7, orphans=2).page(7)
+
+    assert [item.position for item in page] == list(range(43, 51))
+    assert page.paginator.num_pages == 7
+    assert [item.position for item in parallel.ParallelPaginator(items, 7, orphans=2).page(6)] == list(range(36, 43))
+
+
+def test_page_past_the_end_should_fail(items):
+    with pytest.raises(EmptyPage):
+        parallel.ParallelPaginator(items, 5).page(11)
+
+
+def test_count_runs_in_another_thread(items, monkeypatch):
+    threads = []
+
+    def count(queryset):
+        threads.append(threading.current_thread())
+        return queryset.count()
+
+    monkeypatch.setattr(parallel, '_count', count)
+    paging = make_paginator(parallel.ParallelPaginator(items, 5).page(2), 5)
+
+    assert threads and threads[0] is not threading.current_thread()
+    assert paging.pages[-1].number == 5
+
+
+@pytest.mark.parametrize('max_age, closed', [(60, False), (0, True)])
+def test_worker_connections_follow_conn_max_age(items, monkeypatch, max_age, closed):
+    parallel.shutdown_executor()
+    monkeypatch.setitem(connections.settings['default'], 'CONN_MAX_AGE', max_age)
+
+    calls = []
+    close = type(connections['default']).close
+    monkeypatch.setattr(type(connections['default']), 'close', lambda self: calls.append(self) or close(self))
+
+    try:
+        for number in (1, 2, 3):
+            parallel.ParallelPaginator(items, 5).page(number)
+        assert bool(calls) == closed
+    finally:
+        parallel.shutdown_executor()
+
+    assert not parallel._worker_connections
+
+
+def test_async_page(items):
+    page = asyncio.run(parallel.ParallelPaginator(items, 5).apage(3))
+
+    assert [item.position for item in page] == [11, 12, 13, 14, 15]
+    assert make_paginator(page, 5).last.number == 10
@@ -0,0 +1,80 @@
+from concurrent.futures import wait
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.prefetch import PrefetchPaginator
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def items(make_items):
+    cache.clear()
+    return make_items().order_by('position')
+
+
+def test_page_matches_paginator(items):
+    for number in (1, 5, 10):
+        paginator = PrefetchPaginator(items, 5)
+        assert list(paginator.page(number)) == list(Paginator(items, 5).page(number))
+        wait(paginator.prefetching)
+
+
+def test_next_page_is_prefetched(items):
+    paginator = PrefetchPaginator(items, 5)
+    paginator.page(4)
+    wait(paginator.prefetching)
+
+    assert cache.get(paginator.prefetch_key(5)) == list(items.values_list('pk', flat=True)[20:25])
+    assert cache.get(paginator.prefetch_key(3)) is None
+
+    paginator = PrefetchPaginator(items, 5)
+    paginator.count
+
+    with CaptureQueriesContext(connection) as queries:
+        page = paginator.page(5)
+        positions = [item.position for item in page]
+
+    wait(paginator.prefetching)
+    assert positions == [21, 22, 23, 24, 25]
+    assert len(queries) == 1
+    assert 'OFFSET' not in queries[0]['sql']
+
+
+def test_previous_page_and_orphans(items):
+    paginator = PrefetchPaginator(items, 7, orphans=2, prefetch_previous=True)
+    paginator.page(7)
+    wait(paginator.prefetching)
+
+    assert len(paginator.prefetching) == 1
+    assert cache.get(paginator.prefetch_key(6)) == list(items.values_list('pk', flat=True)[35:42])
+
+    paginator = PrefetchPaginator(items, 7, orphans=2)
+    paginator.page(6)
+    wait(paginator.prefetching)
+
+    assert [item.position for item in PrefetchPaginator(items, 7, orphans=2).page(7)] == list(range(43, 51))
+
+
+def test_ordering_is_part_of_the_key(items):
+    assert (
+        PrefetchPaginator(items, 5).prefetch_key(2)
+        != PrefetchPaginator(items.order_by('-position'), 5).prefetch_key(2)
+    )
+
+
+def test_custom_executor(items):
+    calls = []
+
+    class Executor(object):
+        def submit(self, function, *args):
+            calls.append(args[-1])
+
+    paginator = PrefetchPaginator(items, 5, executor=Executor(), prefetch_previous=True)
+    paginator.page(3)
+
+    assert calls == [4, 2]
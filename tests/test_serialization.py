@@ -0,0 +1,81 @@
+import datetime
+import json
+
+from django.core.paginator import Paginator
+import pytest
+
+from smart_pagination import keyset, serialization
+from smart_pagination.pagination import make_paginator
+from smart_pagination.serialization import dumps, json_response
+from .models import Item
+
+paginator = Paginator(range(100), 10)
+
+
+def test_to_dict():
+    paging = make_paginator(paginator.page(5), 3, url_prefix='?q=a&page=')
+
+    assert paging.to_dict() == {
+        'window': [1, 4, [4, 5, 6], 6, 10, 5],
+        'url_prefix': '?q=a&page=',
+        'approximate': False,
+    }
+
+
+def test_to_dict_at_the_edges():
+    assert make_paginator(paginator.page(1), 3).to_dict()['window'] == [None, None, [1, 2, 3], 2, 10, 1]
+    assert make_paginator(paginator.page(10), 3).to_dict()['window'] == [1, 9, [8, 9, 10], None, None, 10]
+
+
+def test_to_json_is_compact():
+    paging = make_paginator(paginator.page(5), 3, url_prefix='?page=')
+
+    assert json.loads(paging.to_json()) == paging.to_dict()
+    assert b' ' not in paging.to_json()
+
+
+DATA = {
+    'window': [1, None, [1, 2]],
+    'date': datetime.date(2020, 1, 2),
+    'datetime': datetime.datetime(2020, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+    'time': datetime.time(3, 4, 5, 123456),
+}
+DUMPED = (
+    b'{"window":[1,null,[1,2]],"date":"2020-01-02","datetime":"2020-01-02T03:04:05.123Z","time":"03:04:05.123"}'
+)
+
+
+def test_dumps_without_orjson(monkeypatch):
+    monkeypatch.setattr(serialization, 'orjson', None)
+
+    assert dumps(DATA) == DUMPED
+
+
+def test_dumps_with_orjson():
+    pytest.importorskip('orjson')
+
+    assert dumps(DATA) == DUMPED
+
+
+def test_json_response():
+    paging = make_paginator(paginator.page(2), 3)
+    response = json_response(paging, paginator.page(2), status=206)
+
+    assert response.status_code == 206
+    assert response['Content-Type'] == 'application/json'
+    assert json.loads(response.content) == {'pagination': paging.to_dict(), 'results': list(range(10, 20))}
+
+
+@pytest.mark.django_db
+def test_keyset_to_dict(make_items):
+    make_items()
+    items = keyset.KeysetPaginator(Item.objects.order_by('position'), 5)
+    page_obj = items.page(items.page(items.page().next_cursor).next_cursor)
+
+    data = keyset.make_paginator(page_obj, 3, url_prefix='?cursor=').to_dict()
+
+    assert data['window'] == [
+        '', page_obj.previous_cursor, [page_obj.previous_cursor, page_obj.cursor, page_obj.next_cursor],
+        page_obj.next_cursor, keyset.encode_cursor(keyset.LAST), page_obj.cursor,
+    ]
+    assert data['url_prefix'] == '?cursor='
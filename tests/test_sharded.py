@@ -0,0 +1,89 @@
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.db import connections
+from django.template import Context, Template
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.pagination import make_paginator
+from smart_pagination.sharded import ShardedPaginator
+from .models import Item
+
+pytestmark = pytest.mark.django_db(transaction=True, databases=['default', 'other'])
+
+
+@pytest.fixture
+def items(make_items):
+    cache.clear()
+    # Even positions on one database, odd positions on the other
+    make_items(range(2, 51, 2), name=lambda i: 'item')
+    make_items(range(1, 50, 2), name=lambda i: 'item', using='other')
+    make_items(range(60, 65), name=lambda i: 'late', using='other')
+    return [Item.objects.using(alias).order_by('position') for alias in ('default', 'other')]
+
+
+def test_count_is_the_sum_of_the_shards(items):
+    paginator = ShardedPaginator(items, 10)
+
+    assert paginator.shard_counts == [25, 30]
+    assert paginator.count == 55
+    assert paginator.num_pages == 6
+
+
+def test_pages_are_merged(items):
+    paginator = ShardedPaginator(items, 10)
+
+    assert [item.position for item in paginator.page(1)] == list(range(1, 11))
+    assert [item.position for item in paginator.page(5)] == list(range(41, 51))
+    assert [item.position for item in paginator.page(6)] == list(range(60, 65))
+
+    with pytest.raises(EmptyPage):
+        paginator.page(7)
+
+
+def test_descending_ordering_and_orphans(items):
+    paginator = ShardedPaginator(items, 10, orphans=5, ordering=['-position'])
+
+    assert paginator.num_pages == 5
+    assert [item.position for item in paginator.page(1)] == [64, 63, 62, 61, 60, 50, 49, 48, 47, 46]
+    assert [item.position for item in paginator.page(5)] == list(range(15, 0, -1))
+
+
+def test_page_reads_only_what_it_needs(items):
+    paginator = ShardedPaginator(items, 5)
+    paginator.count
+
+    with CaptureQueriesContext(connections['default']) as default, \
+            CaptureQueriesContext(connections['other']) as other:
+        page = paginator.page(2)
+
+    assert [item.position for item in page] == [6, 7, 8, 9, 10]
+    assert len(default) == 1 and len(other) == 1
+    assert 'LIMIT 10' in default[0]['sql'] and 'OFFSET' not in default[0]['sql']
+
+
+def test_shard_counts_are_cached(items, make_items):
+    ShardedPaginator(items, 10, cache_alias='default').count
+    make_items(range(70, 73), name=lambda i: 'late', using='other')
+
+    assert ShardedPaginator(items, 10, cache_alias='default').count == 55
+    assert ShardedPaginator(items, 10).count == 58
+
+
+def test_make_paginator_and_template(items):
+    page_obj = ShardedPaginator(items, 10).page(3)
+    paging = make_paginator(page_obj, 3)
+
+    assert [page.number for page in paging.pages] == [2, 3, 4]
+    assert paging.last.number == 6
+
+    template = Template(
+        '{% load pagination_tags %}{% paginate page_obj 3 paging %}'
+        '{% for page in paging.pages %}{{ page.number }}{% endfor %}{% endpaginate %}'
+    )
+    assert template.render(Context({'page_obj': page_obj})) == '234'
+
+
+def test_single_queryset_matches_paginator(items):
+    for number in (1, 2, 3):
+        assert list(ShardedPaginator(items[:1], 10).page(number)) == list(Paginator(items[0], 10).page(number))
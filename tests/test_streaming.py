@@ -0,0 +1,63 @@
+from django.core.paginator import Paginator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from smart_pagination.pagination import iter_pages, make_paginator
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def items(make_items):
+    return make_items(range(1, 48)).order_by('position')
+
+
+def test_pages_match_paginator(items):
+    paginator = Paginator(items, 5)
+    pages = list(iter_pages(items, 5, num_links=3, url_prefix='?page=', chunk_size=7))
+
+    assert [page_obj.number for page_obj, paging in pages] == list(paginator.page_range)
+
+    for page_obj, paging in pages:
+        expected = paginator.page(page_obj.number)
+        expected_paging = make_paginator(expected, 3, '?page=')
+
+        assert list(page_obj) == list(expected)
+        assert page_obj.has_next() == expected.has_next()
+        assert [page.url for page in paging.pages] == [page.url for page in expected_paging.pages]
+        assert paging.last is expected_paging.last or paging.last.number == expected_paging.last.number
+
+
+def test_chunks_seek_instead_of_offset(items):
+    with CaptureQueriesContext(connection) as queries:
+        pages = list(iter_pages(items, 10, chunk_size=20))
+
+    assert len(pages) == 5
+    # One count, then three chunks of 20 rows
+    assert len(queries) == 4
+    assert not any('OFFSET' in query['sql'] for query in queries)
+
+
+def test_exact_pages_and_ordering(items):
+    pages = list(iter_pages(items, 47, ordering=['-position']))
+
+    assert len(pages) == 1
+    assert [item.position for item in pages[0][0]][:3] == [47, 46, 45]
+    assert pages[0][1].next is None
+
+
+def test_rows_inserted_while_streaming(items, make_items):
+    pages = iter_pages(items, 10, chunk_size=10)
+    next(pages)
+    make_items(range(100, 105), name=lambda i: 'late')
+
+    pages = list(pages)
+
+    assert [page_obj.number for page_obj, paging in pages] == [2, 3, 4, 5, 6]
+    assert [item.position for item in pages[-1][0]] == [103, 104]
+    assert pages[-1][0].paginator.num_pages == 6
+
+
+def test_empty_queryset(items):
+    assert list(iter_pages(items.none(), 10)) == []
@@ -170,22 +170,74 @@ def test_pagination_with_wrong_page_obj_should_fail():
 def test_pagination_with_str_num_links_should_fail():
     template_string = FORMAT_STRING.substitute(args="page_obj 'abc' paging")
 
-    request = HttpRequest()
+    with pytest.raises(TemplateSyntaxError):
+        Template(template_string)
+
+
+def test_pagination_with_non_int_num_links_should_fail():
+    template_string = FORMAT_STRING.substitute(args="page_obj 2.5 paging")
+
+    with pytest.raises(TemplateSyntaxError):
+        Template(template_string)
+
+
+def test_pagination_with_filtered_num_links():
+    template_string = FORMAT_STRING.substitute(args="page_obj settings.LINKS|default:4 paging")
 
     tpl = Template(template_string)
     ctx = Context({
         'page_obj': paginator.page(1),
-        'request': request,
+        'settings': {},
+    })
+
+    response = tpl.render(ctx)
+    assert '1234' in response
+    assert '12345' not in response
+
+
+def test_pagination_with_str_num_links_variable_should_fail():
+    template_string = FORMAT_STRING.substitute(args="page_obj num_links paging")
+
+    tpl = Template(template_string)
+    ctx = Context({
+        'page_obj': paginator.page(1),
+        'num_links': 'abc',
     })
 
     with pytest.raises(TemplateSyntaxError):
         tpl.render(ctx)
 
 
-def test_pagination_with_non_int_num_links_should_fail():
-    template_string = FORMAT_STRING.substitute(args="page_obj 2.5 paging")
+def test_pagination_page_urls():
+    template_string = '''
+    {% load pagination_tags %}
+    {% paginate page_obj 3 paging 'page' %}{% for page in paging.pages %}{{ page.url }} {% endfor %}{% endpaginate %}
+    '''
 
     request = HttpRequest()
+    request.GET.update({
+        'page': '2',
+        'term': 'value',
+    })
+
+    tpl = Template(template_string)
+    ctx = Context({
+        'page_obj': paginator.page(2),
+        'request': request,
+    })
+
+    response = tpl.render(ctx)
+    assert '?term=value&amp;page=1 ?term=value&amp;page=2 ?term=value&amp;page=3' in response
+
+
+def test_pagination_querystring_is_processed_once_per_request():
+    template_string = FORMAT_STRING.substitute(args="page_obj 5 paging 'page'")
+
+    request = HttpRequest()
+    request.GET.update({
+        'page': '2',
+        'term1': 'param1',
+    })
 
     tpl = Template(template_string)
     ctx = Context({
@@ -193,5 +245,100 @@ def test_pagination_with_non_int_num_links_should_fail():
         'request': request,
     })
 
-    with pytest.raises(TemplateSyntaxError):
-        tpl.render(ctx)
+    tpl.render(ctx)
+    request.GET = request.GET.copy()
+    request.GET['term1'] = 'changed'
+
+    response = tpl.render(ctx)
+    assert 'term1=param1' in response
+
+
+def test_pagination_hints():
+    template_string = '''
+    {% load pagination_tags %}
+    {% paginate page_obj 3 paging 'page' %}{% pagination_hints paging %}{% endpaginate %}
+    '''
+
+    request = HttpRequest()
+    request.GET.update({
+        'page': '2',
+        'term': 'value',
+    })
+
+    tpl = Template(template_string)
+    ctx = Context({
+        'page_obj': paginator.page(2),
+        'request': request,
+    })
+
+    response = tpl.render(ctx)
+    assert (
+        '<link rel="prev" href="?term=value&amp;page=1">'
+        '<link rel="next" href="?term=value&amp;page=3">'
+        '<link rel="prefetch" href="?term=value&amp;page=3">'
+    ) in response
+
+
+def test_pagination_hints_without_prefetch_or_page_kwarg():
+    template_string = '''
+    {% load pagination_tags %}
+    {% paginate page_obj 3 paging 'page' %}[{% pagination_hints paging prefetch=False %}]{% endpaginate %}
+    {% paginate page_obj 3 paging %}[{% pagination_hints paging %}]{% endpaginate %}
+    '''
+
+    tpl = Template(template_string)
+    ctx = Context({
+        'page_obj': paginator.page(1),
+        'request': HttpRequest(),
+    })
+
+    response = tpl.render(ctx)
+    assert '[<link rel="next" href="?page=2">]' in response
+    assert '[]' in response
+
+
+def test_render_pagination():
+    template_string = '''
+    {% load pagination_tags %}
+    {% render_pagination page_obj 3 'page' theme='bootstrap' %}
+    '''
+
+    request = HttpRequest()
+    request.GET.update({
+        'page': '2',
+        'term': 'value',
+    })
+
+    tpl = Template(template_string)
+    ctx = Context({
+        'page_obj': paginator.page(2),
+        'request': request,
+    })
+
+    response = tpl.render(ctx)
+    assert '<ul class="pagination">' in response
+    assert '<a class="page-link" href="?term=value&amp;page=3">3</a>' in response
+    assert '<span class="page-link">2</span>' in response
+
+
+def test_render_pagination_with_default_page_kwarg_and_theme():
+    tpl = Template('{% load pagination_tags %}{% render_pagination page_obj 3 %}')
+    ctx = Context({
+        'page_obj': paginator.page(1),
+    })
+
+    response = tpl.render(ctx)
+    assert response.startswith('<nav class="pagination"><span class="current" aria-current="page">1</span>')
+    assert '<a href="?page=2">2</a>' in response
+
+
+def test_render_pagination_with_wrong_args_should_fail():
+    ctx = Context({
+        'page_obj': paginator.page(1),
+    })
+
+    for args in ("page_obj 'a'", "'a' 3", "page_obj 3 theme='unknown'"):
+        tpl = Template('{% load pagination_tags %}{% render_pagination ' + args + ' %}')
+
+        with pytest.raises(TemplateSyntaxError):
+            tpl.render(ctx)
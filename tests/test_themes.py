@@ -0,0 +1,65 @@
+from django.core.paginator import Paginator
+import pytest
+
+from smart_pagination import themes
+from smart_pagination.pagination import make_paginator
+
+paginator = Paginator(range(100), 10)
+
+
+def test_plain_theme():
+    paging = make_paginator(paginator.page(5), 3, url_prefix='?page=')
+
+    assert themes.render(paging) == (
+        '<nav class="pagination">'
+        '<a href="?page=1">&laquo;</a>'
+        '<a href="?page=4">&lsaquo;</a>'
+        '<a href="?page=4">4</a>'
+        '<span class="current" aria-current="page">5</span>'
+        '<a href="?page=6">6</a>'
+        '<a href="?page=6">&rsaquo;</a>'
+        '<a href="?page=10">&raquo;</a>'
+        '</nav>'
+    )
+
+
+def test_bootstrap_theme_on_first_page():
+    paging = make_paginator(paginator.page(1), 2, url_prefix='?page=')
+
+    assert themes.render(paging, 'bootstrap') == (
+        '<nav><ul class="pagination">'
+        '<li class="page-item active" aria-current="page"><span class="page-link">1</span></li>'
+        '<li class="page-item"><a class="page-link" href="?page=2">2</a></li>'
+        '<li class="page-item"><a class="page-link" href="?page=2">&rsaquo;</a></li>'
+        '<li class="page-item"><a class="page-link" href="?page=10">&raquo;</a></li>'
+        '</ul></nav>'
+    )
+
+
+def test_tailwind_theme():
+    html = themes.render(make_paginator(paginator.page(10), 1, url_prefix='?page='), 'tailwind')
+
+    assert html.startswith('<nav class="flex items-center gap-1" aria-label="Pagination">')
+    assert 'bg-blue-600 text-white" aria-current="page">10</span>' in html
+
+
+def test_urls_are_escaped():
+    paging = make_paginator(paginator.page(1), 1, url_prefix='?q=%22a%22&x="><script>&page=')
+
+    assert '<script>' not in themes.render(paging)
+    assert 'href="?q=%22a%22&amp;x=&quot;&gt;&lt;script&gt;&amp;page=2"' in themes.render(paging)
+
+
+def test_custom_theme():
+    theme = themes.Theme('<p>{}</p>', '<a href="{url}">{label}</a>', '<b>{label}</b>', first='First', last='Last')
+    paging = make_paginator(paginator.page(5), 1, url_prefix='?page=')
+
+    assert themes.render(paging, theme) == (
+        '<p><a href="?page=1">First</a><a href="?page=4">&lsaquo;</a><b>5</b>'
+        '<a href="?page=6">&rsaquo;</a><a href="?page=10">Last</a></p>'
+    )
+
+
+def test_unknown_theme_should_fail():
+    with pytest.raises(KeyError):
+        themes.render(make_paginator(paginator.page(1), 3, url_prefix='?page='), 'unknown')
@@ -0,0 +1,63 @@
+from django.core.paginator import Paginator
+import pytest
+
+from smart_pagination import windows
+from smart_pagination.pagination import make_paginator, window_cache_info
+
+
+def numbers(page):
+    return page.number if page is not None else None
+
+
+def window(paging):
+    return (
+        numbers(paging.first), numbers(paging.prev), [page.number for page in paging.pages],
+        numbers(paging.next), numbers(paging.last), [page.number for page in paging.pages if page.is_current],
+    )
+
+
+@pytest.mark.parametrize('page_count', [1, 2, 5, 6, 7, 10, 23])
+@pytest.mark.parametrize('num_links', [1, 2, 5, 6, 10])
+def test_windows_match_make_paginator(page_count, num_links):
+    paginator = Paginator(range(page_count), 1)
+    expected = [make_paginator(paginator.page(number), num_links, '?page=') for number in paginator.page_range]
+    pagings = list(windows.iter_windows(page_count, num_links, '?page='))
+
+    assert [window(paging) for paging in pagings] == [window(paging) for paging in expected]
+    assert [paging.to_dict() for paging in pagings] == [paging.to_dict() for paging in expected]
+    assert [page.url for page in pagings[-1].pages] == [page.url for page in expected[-1].pages]
+
+
+def test_windows_are_not_cached():
+    before = window_cache_info().currsize
+    list(windows.iter_windows(1000, 7))
+
+    assert window_cache_info().currsize == before
+
+
+def test_no_pages():
+    assert list(windows.iter_windows(0, 5)) == []
+
+
+@pytest.mark.parametrize('page_count', [1, 5, 6, 23])
+@pytest.mark.parametrize('num_links', [1, 2, 5, 6])
+def test_window_arrays(page_count, num_links):
+    pytest.importorskip('numpy')
+    arrays = windows.window_arrays(page_count, num_links)
+
+    for i, paging in enumerate(windows.iter_windows(page_count, num_links)):
+        data = paging.to_dict()['window']
+
+        assert arrays['number'][i] == data[5]
+        assert arrays['first'][i] == (data[0] or 0)
+        assert arrays['prev'][i] == (data[1] or 0)
+        assert [arrays['start'][i], arrays['end'][i]] == [data[2][0], data[2][-1]]
+        assert arrays['next'][i] == (data[3] or 0)
+        assert arrays['last'][i] == (data[4] or 0)
+
+
+def test_window_arrays_without_numpy(monkeypatch):
+    monkeypatch.setattr(windows, 'numpy', None)
+
+    with pytest.raises(ImportError):
+        windows.window_arrays(10, 5)